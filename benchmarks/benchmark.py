@@ -0,0 +1,314 @@
+import sys
+import os
+import json
+import hashlib
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import cv2
+import numpy as np
+from PyQt6.QtCore import Qt
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 저장소 루트를 경로에 추가하여 두 앱의 작업 클래스를 그대로 측정
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.ffmpeg_tools import find_ffmpeg_executable  # noqa: E402
+from video_converter.video_converter import VideoConverter  # noqa: E402
+from video_to_images.video_frame_extractor import VideoProcessor  # noqa: E402
+from job_daemon.job_metrics import JobMetrics  # noqa: E402
+
+
+DEFAULT_MEDIA_DIR = os.path.join(tempfile.gettempdir(), 'dabin-benchmark-media')
+DEFAULT_THRESHOLD = 0.15
+# 합성 영상 생성 방식을 바꾸면 올려서 이전에 만든 영상을 재사용하지 않도록 함
+CLIP_FORMAT_VERSION = 1
+
+# 합성 테스트 영상 (name, 가로, 세로, fps, 길이(초), 생성 방식, 코덱, 가변 프레임레이트 여부)
+#   opencv: cv2.VideoWriter로 생성 (FFmpeg 없이도 사용 가능)
+#   ffmpeg: testsrc2 소스로 생성
+CLIPS = [
+    {'name': 'mjpg_480p_30', 'width': 640, 'height': 480, 'fps': 30, 'duration': 10,
+     'generator': 'opencv', 'codec': 'MJPG', 'extension': 'avi'},
+    {'name': 'mp4v_720p_30', 'width': 1280, 'height': 720, 'fps': 30, 'duration': 10,
+     'generator': 'opencv', 'codec': 'mp4v', 'extension': 'mp4'},
+    {'name': 'mp4v_1080p_60', 'width': 1920, 'height': 1080, 'fps': 60, 'duration': 5,
+     'generator': 'opencv', 'codec': 'mp4v', 'extension': 'mp4'},
+    {'name': 'h264_1080p_30', 'width': 1920, 'height': 1080, 'fps': 30, 'duration': 20,
+     'generator': 'ffmpeg', 'codec': 'libx264', 'extension': 'mp4'},
+    {'name': 'h264_2160p_24', 'width': 3840, 'height': 2160, 'fps': 24, 'duration': 5,
+     'generator': 'ffmpeg', 'codec': 'libx264', 'extension': 'mp4'},
+    {'name': 'h264_720p_vfr', 'width': 1280, 'height': 720, 'fps': 30, 'duration': 10,
+     'generator': 'ffmpeg', 'codec': 'libx264', 'extension': 'mkv', 'vfr': True},
+]
+
+# 측정 시나리오 (기존 앱의 모드를 그대로 사용)
+EXTRACTION_MODES = [
+    {'mode': 'extract_all', 'extract_all': True, 'custom_fps': 1, 'sample_mode': 'fps', 'interval': 1},
+    {'mode': 'fps_1', 'extract_all': False, 'custom_fps': 1, 'sample_mode': 'fps', 'interval': 1},
+    {'mode': 'fps_5', 'extract_all': False, 'custom_fps': 5, 'sample_mode': 'fps', 'interval': 1},
+    {'mode': 'interval_4', 'extract_all': False, 'custom_fps': 1, 'sample_mode': 'interval', 'interval': 4},
+]
+CONVERSION_MODES = [
+    {'mode': scale_mode, 'output_format': 'mp4', 'pixel_format': 'yuv420p',
+     'width': 1280, 'height': 720, 'scale_mode': scale_mode}
+    for scale_mode in ('exact', 'aspect_fit', 'aspect_pad')
+]
+
+
+def ffmpeg_available():
+    return shutil.which(find_ffmpeg_executable('ffmpeg')) is not None
+
+
+def clip_path(media_dir, clip):
+    """영상 설정이 파일 이름에 반영되므로 CLIPS 항목을 바꾸면 새로 생성됨"""
+    key = json.dumps({**clip, 'format_version': CLIP_FORMAT_VERSION}, sort_keys=True)
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(media_dir, f"{clip['name']}-{digest}.{clip['extension']}")
+
+
+def generate_clip(media_dir, clip):
+    """재현 가능한 합성 영상 생성 (이미 있으면 재사용)"""
+    path = clip_path(media_dir, clip)
+    if os.path.exists(path):
+        return path
+    os.makedirs(media_dir, exist_ok=True)
+
+    # 생성이 중단되어도 불완전한 파일이 재사용되지 않도록 임시 파일에 쓴 뒤 이름을 바꿈
+    # (컨테이너 형식을 확장자로 판단하므로 확장자는 유지)
+    temp_path = os.path.join(media_dir, f".{os.getpid()}-{os.path.basename(path)}")
+    try:
+        write_clip(temp_path, clip)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return path
+
+
+def write_clip(path, clip):
+    if clip['generator'] == 'opencv':
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*clip['codec']), clip['fps'],
+                                 (clip['width'], clip['height']))
+        if not writer.isOpened():
+            raise RuntimeError(f"VideoWriter를 열 수 없습니다: {clip['codec']}")
+
+        # 고정 시드의 노이즈 배경 + 이동하는 사각형 (프레임마다 내용이 달라 인코딩 부하가 실제와 비슷함)
+        rng = np.random.default_rng(0)
+        background = rng.integers(0, 256, (clip['height'], clip['width'], 3), dtype=np.uint8)
+        box_size = clip['height'] // 4
+        for index in range(clip['fps'] * clip['duration']):
+            frame = np.roll(background, index * 4, axis=1)
+            x = (index * 8) % max(1, clip['width'] - box_size)
+            cv2.rectangle(frame, (x, box_size), (x + box_size, box_size * 2), (0, 0, 255), -1)
+            cv2.putText(frame, str(index), (10, clip['height'] - 20), cv2.FONT_HERSHEY_SIMPLEX,
+                        2, (255, 255, 255), 3)
+            writer.write(frame)
+        writer.release()
+        return
+
+    cmd = [find_ffmpeg_executable('ffmpeg'), '-v', 'error', '-y', '-f', 'lavfi',
+           '-i', f"testsrc2=size={clip['width']}x{clip['height']}:rate={clip['fps']}:duration={clip['duration']}"]
+    if clip.get('vfr'):
+        # 프레임 간격을 1.4 / 0.6 프레임으로 번갈아 배치한 가변 프레임레이트 영상
+        cmd.extend(['-vf', 'setpts=(N+0.4*mod(N\\,2))/(FRAME_RATE*TB)', '-fps_mode', 'passthrough'])
+    cmd.extend(['-c:v', clip['codec'], '-pix_fmt', 'yuv420p', path])
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"테스트 영상 생성 실패: {result.stderr}")
+
+
+def peak_rss_mb(who):
+    """최대 메모리 사용량 (MB, 측정 불가 시 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    divisor = 1024 * 1024 if platform.system() == 'Darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def run_case(case):
+    """
+    벤치마크 케이스 하나를 현재 프로세스에서 실행
+    최대 메모리 사용량을 케이스별로 분리하기 위해 케이스마다 새 프로세스에서 호출됨
+    """
+    output_dir = tempfile.mkdtemp(prefix='dabin-benchmark-')
+    metrics = JobMetrics(kind=case['kind'])
+    outcome = {'error': None, 'saved_frames': 0}
+
+    def on_error(message):
+        outcome['error'] = message
+
+    def on_frame_extracted(count, filename):
+        outcome['saved_frames'] = count
+
+    direct = Qt.ConnectionType.DirectConnection
+    try:
+        if case['kind'] == 'extract':
+            runner = VideoProcessor(case['video_path'], output_dir, case['interval'],
+                                    case['extract_all'], case['custom_fps'], metrics=metrics,
+                                    sample_mode=case['sample_mode'])
+            runner.frame_extracted.connect(on_frame_extracted, direct)
+        else:
+            output_path = os.path.join(output_dir, f"output.{case['output_format']}")
+            runner = VideoConverter(case['video_path'], output_path, case['output_format'],
+                                    case['pixel_format'], case['width'], case['height'], case['scale_mode'],
+                                    metrics=metrics)
+        runner.error_occurred.connect(on_error, direct)
+
+        start = time.perf_counter()
+        runner.run()
+        wall_time = time.perf_counter() - start
+
+        result = {'wall_time': round(wall_time, 4), 'error': outcome['error']}
+        # 단계별 누적 시간 (decode / encode / write / subprocess)
+        for stage, histogram in metrics.to_dict()['stages'].items():
+            result[f"{stage}_seconds"] = histogram['sum']
+        result['bytes_written'] = metrics.counters['bytes_written']
+        if case['kind'] == 'extract':
+            result['saved_frames'] = outcome['saved_frames']
+            result['extraction_fps'] = round(outcome['saved_frames'] / wall_time, 2) if wall_time else None
+            result['source_fps'] = round(case['source_frames'] / wall_time, 2) if wall_time else None
+            result['peak_rss_mb'] = peak_rss_mb(resource.RUSAGE_SELF) if resource else None
+        else:
+            result['speed'] = round(case['source_duration'] / wall_time, 3) if wall_time else None
+            result['peak_rss_mb'] = peak_rss_mb(resource.RUSAGE_CHILDREN) if resource else None
+        return result
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def build_cases(media_dir, include_conversion):
+    cases = []
+    has_ffmpeg = ffmpeg_available()
+    for clip in CLIPS:
+        if clip['generator'] == 'ffmpeg' and not has_ffmpeg:
+            print(f"FFmpeg가 없어 건너뜀: {clip['name']}")
+            continue
+        video_path = generate_clip(media_dir, clip)
+        common = {
+            'clip': clip['name'],
+            'video_path': video_path,
+            'source_frames': clip['fps'] * clip['duration'],
+            'source_duration': clip['duration'],
+        }
+        for mode in EXTRACTION_MODES:
+            cases.append({**common, **mode, 'kind': 'extract', 'name': f"extract/{clip['name']}/{mode['mode']}"})
+        if include_conversion and has_ffmpeg:
+            for mode in CONVERSION_MODES:
+                cases.append({**common, **mode, 'kind': 'convert', 'name': f"convert/{clip['name']}/{mode['mode']}"})
+    return cases
+
+
+def run_case_in_subprocess(case):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--run-case', json.dumps(case)],
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return {'error': result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "알 수 없는 오류"}
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    """반복 측정 결과를 중앙값으로 요약"""
+    summary = dict(samples[0])
+    for key, value in samples[0].items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            values = [sample[key] for sample in samples if sample.get(key) is not None]
+            summary[key] = round(statistics.median(values), 4)
+    summary['wall_time_samples'] = [sample.get('wall_time') for sample in samples]
+    return summary
+
+
+def environment_info():
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'opencv': cv2.__version__,
+        'ffmpeg': None,
+    }
+    if ffmpeg_available():
+        result = subprocess.run([find_ffmpeg_executable('ffmpeg'), '-version'], capture_output=True, text=True)
+        info['ffmpeg'] = result.stdout.splitlines()[0] if result.stdout else None
+    return info
+
+
+def compare_with_baseline(results, baseline, threshold):
+    """기준 결과 대비 느려지거나 메모리가 늘어난 케이스 목록 반환"""
+    regressions = []
+    for name, current in results['cases'].items():
+        previous = baseline['cases'].get(name)
+        if not previous or current.get('error') or previous.get('error'):
+            continue
+        for metric in ('wall_time', 'peak_rss_mb'):
+            old_value, new_value = previous.get(metric), current.get(metric)
+            if old_value and new_value and new_value > old_value * (1 + threshold):
+                regressions.append(f"{name}: {metric} {old_value} -> {new_value} "
+                                   f"(+{(new_value / old_value - 1) * 100:.1f}%)")
+    return regressions
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("1 이상의 정수여야 합니다.")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프레임 추출 / 비디오 변환 벤치마크")
+    parser.add_argument('--media-dir', default=DEFAULT_MEDIA_DIR, help="합성 테스트 영상 저장 폴더")
+    parser.add_argument('--repeat', type=positive_int, default=3, help="케이스별 반복 횟수 (중앙값 사용)")
+    parser.add_argument('--filter', default='', help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument('--skip-conversion', action='store_true', help="비디오 변환 케이스 제외")
+    parser.add_argument('--output', help="결과 JSON 저장 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 경로")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀로 판단할 증가 비율 (기본 0.15 = 15%%)")
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return
+
+    cases = [case for case in build_cases(args.media_dir, not args.skip_conversion) if args.filter in case['name']]
+    results = {'environment': environment_info(), 'repeat': args.repeat, 'cases': {}}
+    for case in cases:
+        samples = [run_case_in_subprocess(case) for _ in range(args.repeat)]
+        errors = [sample['error'] for sample in samples if sample.get('error')]
+        summary = {'error': errors[0]} if errors else summarize(samples)
+        results['cases'][case['name']] = summary
+        if errors:
+            print(f"{case['name']}: 오류 - {errors[0]}")
+        else:
+            print(f"{case['name']}: {summary['wall_time']:.3f}s, 최대 메모리 {summary.get('peak_rss_mb')} MB")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("성능 회귀 발견:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("기준 결과 대비 성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+@echo off
+chcp 65001 >nul 2>&1
+
+REM Job daemon launcher
+echo Starting Job Daemon...
+echo.
+
+REM Change to script directory
+cd /d "%~dp0"
+
+REM Check if uv is installed
+where uv >nul 2>&1
+if %errorlevel% neq 0 (
+    echo uv is not installed. Setting up uv and dependencies...
+    echo.
+
+    call setup.bat
+    if %errorlevel% neq 0 (
+        echo Setup failed!
+        pause
+        exit /b 1
+    )
+    echo.
+)
+
+REM Run application with uv
+echo Launching Job Daemon...
+uv run python job_daemon/job_daemon.py
+
+REM Keep window open if error occurred
+if %errorlevel% neq 0 (
+    echo.
+    echo An error occurred. Press any key to close...
+    pause >nul
+)
\ No newline at end of file
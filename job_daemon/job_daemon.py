@@ -0,0 +1,558 @@
+import sys
+import os
+import json
+import hmac
+import time
+import secrets
+import inspect
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from PyQt6.QtCore import Qt
+
+from job_queue import (JobQueue, SCHEDULE_ORDERS, STATUS_QUEUED, STATUS_RUNNING, STATUS_PAUSED, STATUS_COMPLETED,
+                       STATUS_FAILED, STATUS_CANCELLED, FINISHED_STATUSES)
+from watch_folder import FolderWatcher, load_watch_config
+from job_metrics import JobMetrics, MetricsAggregate
+import resource_governor
+
+# 저장소 루트를 경로에 추가하여 두 앱의 작업 클래스를 그대로 재사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.daemon_client import DEFAULT_HOST, DEFAULT_PORT, DAEMON_DIR, TOKEN_FILENAME  # noqa: E402
+from video_converter.video_converter import VideoConverter, estimate_conversion  # noqa: E402
+from video_to_images.video_frame_extractor import VideoProcessor, validate_sampling  # noqa: E402
+
+
+DEFAULT_DB_PATH = os.path.join(DAEMON_DIR, 'jobs.db')
+# API 토큰은 DB와 같은 폴더의 TOKEN_FILENAME에 저장 (앱은 shared/daemon_client.py의 DAEMON_TOKEN_PATH로 읽음)
+EVENT_POLL_INTERVAL = 0.5
+# --metrics-dir에 저장하는 전체 작업 합계 파일 (작업별 상세는 job_<id>.json)
+PROMETHEUS_FILENAME = 'dabin_jobs.prom'
+
+# 데몬이 직접 넘기는 인자 (작업 설정으로 지정 불가)
+RESERVED_PARAMS = ('metrics', 'command_prefix', 'creationflags')
+
+# 작업 종류별 실행 클래스와 완료 시그널 이름
+JOB_KINDS = {
+    'convert': (VideoConverter, 'conversion_finished'),
+    'extract': (VideoProcessor, 'finished_extraction'),
+}
+
+
+def load_or_create_token(token_path):
+    """API 토큰을 읽고, 없으면 새로 만들어 소유자만 읽을 수 있는 파일로 저장"""
+    try:
+        fd = os.open(token_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(token_path, encoding='utf-8') as f:
+            token = f.read().strip()
+        if not token:
+            raise ValueError(f"토큰 파일이 비어 있습니다: {token_path}")
+        return token
+
+    token = secrets.token_urlsafe(32)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(token)
+    return token
+
+
+def report_skipped_limits(job_id, skipped):
+    if skipped:
+        print(f"작업 #{job_id}: 적용하지 못한 자원 제한 - {', '.join(skipped)}")
+
+
+class JobDaemon:
+    def __init__(self, queue, worker_count, default_limits=None, metrics_dir=None, sample_interval=1.0):
+        self.queue = queue
+        self.worker_count = worker_count
+        self.default_limits = default_limits or {}
+        self.metrics_dir = metrics_dir
+        self.metrics_aggregate = MetricsAggregate()
+        self.sample_interval = sample_interval
+        self.workers = []
+        self.running_jobs = {}  # job_id -> 실행 중인 VideoConverter / VideoProcessor
+        self.cancel_requested = set()
+        self.jobs_lock = threading.Lock()
+        self.wake_condition = threading.Condition()
+        # 작업 실행과 대기열의 예상 시간 계산이 함께 쓰는 슬롯 (동시에 실행되는 FFmpeg 수를 작업자 수로 제한)
+        self.slots = threading.Semaphore(worker_count)
+        self.is_running = True
+
+    def start(self):
+        for index in range(self.worker_count):
+            worker = threading.Thread(target=self.worker_loop, name=f"job-worker-{index}", daemon=True)
+            worker.start()
+            self.workers.append(worker)
+
+    def stop(self):
+        self.is_running = False
+        with self.wake_condition:
+            self.wake_condition.notify_all()
+        with self.jobs_lock:
+            runners = list(self.running_jobs.values())
+        for runner in runners:
+            runner.stop()
+        for worker in self.workers:
+            worker.join()
+
+    def validate(self, kind, params, resources=None):
+        """작업 설정을 검사하고 정규화한 자원 제한을 반환 (잘못되었으면 ValueError)"""
+        if kind not in JOB_KINDS:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        runner_class, _ = JOB_KINDS[kind]
+        for name in RESERVED_PARAMS:
+            if name in params:
+                raise ValueError(f"{name}는 작업 설정으로 지정할 수 없습니다.")
+        try:
+            arguments = inspect.signature(runner_class).bind(**params)
+        except TypeError as e:
+            raise ValueError(f"잘못된 작업 설정: {str(e)}")
+        if kind == 'extract':
+            # 실행 시점이 아닌 추가 시점에 잘못된 샘플링 설정을 거부
+            arguments.apply_defaults()
+            validate_sampling(arguments.arguments['sample_mode'], arguments.arguments['interval'],
+                              arguments.arguments['custom_fps'], arguments.arguments['extract_all'])
+        return resource_governor.validate_limits(resources or {})
+
+    def submit(self, kind, params, resources=None):
+        resources = self.validate(kind, params, resources)
+        job_id = self.queue.submit(kind, params, resources)
+        with self.wake_condition:
+            self.wake_condition.notify()
+        return job_id
+
+    def submit_ingested(self, path, size, mtime, jobs):
+        """감시 폴더 파일의 (kind, params) 작업들을 처리 기록과 함께 추가 (이미 추가한 파일이면 None)"""
+        job_ids = self.queue.submit_ingested(path, size, mtime, [(kind, params, None) for kind, params in jobs])
+        if job_ids:
+            with self.wake_condition:
+                self.wake_condition.notify_all()
+        return job_ids
+
+    def cancel(self, job_id):
+        if self.queue.cancel_if_queued(job_id):
+            return True
+        with self.jobs_lock:
+            runner = self.running_jobs.get(job_id)
+            if runner is None:
+                return False
+            self.cancel_requested.add(job_id)
+        runner.stop()
+        return True
+
+    def estimate(self, params, resources=None, slot_timeout=None):
+        """
+        변환 작업의 예상 시간 계산 (실패하면 error 항목만 있는 결과 반환)
+        샘플 구간 변환도 작업자 슬롯 하나를 차지하고 실제 작업과 같은 자원 제한을 적용
+        slot_timeout 안에 슬롯을 얻지 못하면 None 반환 (None이면 슬롯이 빌 때까지 대기)
+        """
+        try:
+            limits = {**self.default_limits, **self.validate('convert', params, resources)}
+            command_prefix, creationflags, post_spawn_limits = resource_governor.build_launch_options(limits)
+            converter = VideoConverter(**params, command_prefix=command_prefix, creationflags=creationflags)
+        except Exception as e:
+            return {'error': str(e)}
+
+        def on_process_started(process):
+            if post_spawn_limits:
+                resource_governor.apply_to_process(process.pid, post_spawn_limits)
+
+        if not self.slots.acquire(timeout=slot_timeout):
+            return None
+        try:
+            return estimate_conversion(converter, on_process_started=on_process_started)
+        except Exception as e:
+            return {'error': str(e)}
+        finally:
+            self.slots.release()
+
+    def pause(self, job_id):
+        with self.jobs_lock:
+            runner = self.running_jobs.get(job_id)
+        if runner is None or not runner.pause():
+            return False
+        self.queue.update(job_id, status=STATUS_PAUSED)
+        return True
+
+    def resume(self, job_id):
+        with self.jobs_lock:
+            runner = self.running_jobs.get(job_id)
+        if runner is None or not runner.resume():
+            return False
+        self.queue.update(job_id, status=STATUS_RUNNING)
+        return True
+
+    def worker_loop(self):
+        while self.is_running:
+            if not self.slots.acquire(timeout=1.0):
+                continue  # 예상 시간 계산이 슬롯을 사용 중
+            job = None
+            try:
+                # DB 잠금 등으로 실패해도 작업자 스레드가 끝나지 않도록 이번 차례만 건너뜀
+                job = self.queue.claim_next()
+                if job is not None:
+                    try:
+                        self.run_job(job)
+                    except Exception as e:
+                        self.queue.finish(job['id'], STATUS_FAILED, f"오류 발생: {str(e)}")
+            except Exception as e:
+                target = f"작업 #{job['id']}" if job is not None else "대기열"
+                print(f"{target} 처리 중 오류 발생: {str(e)}")
+            finally:
+                self.slots.release()
+
+            # 대기하는 동안에는 슬롯을 놓아 예상 시간 계산이 실행될 수 있도록 함
+            if job is None:
+                with self.wake_condition:
+                    self.wake_condition.wait(timeout=1.0)
+
+    def run_job(self, job):
+        job_id = job['id']
+        params = job['params']
+        runner_class, finished_signal_name = JOB_KINDS[job['kind']]
+
+        if job['kind'] == 'extract':
+            os.makedirs(params['output_dir'], exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(params['output_path'])), exist_ok=True)
+
+        metrics = None
+        if self.metrics_dir:
+            metrics = JobMetrics(job_id, job['kind'])
+            metrics.observe('queue_wait', job['started_at'] - job['created_at'])
+
+        # 이전 버전에서 검사 없이 저장된 값도 실행 전에 다시 검사 (잘못되면 작업 실패 처리)
+        limits = resource_governor.validate_limits({**self.default_limits, **job['resources']})
+        post_spawn_limits = {}
+        if job['kind'] == 'convert':
+            # 가능한 항목은 nice / taskset 등으로 FFmpeg를 감싸 처음부터 제한된 상태로 실행
+            command_prefix, creationflags, post_spawn_limits = resource_governor.build_launch_options(limits)
+            runner = runner_class(**params, metrics=metrics, command_prefix=command_prefix,
+                                  creationflags=creationflags)
+        else:
+            runner = runner_class(**params, metrics=metrics)
+        outcome = {'status': STATUS_FAILED, 'message': '', 'progress': 0}
+
+        def on_progress(value):
+            # 같은 값이 반복되는 경우 DB 쓰기를 생략
+            if value != outcome['progress']:
+                outcome['progress'] = value
+                try:
+                    self.queue.update(job_id, progress=value)
+                except Exception as e:
+                    # 직접 연결된 슬롯이므로 예외를 밖으로 전달하지 않음 (진행률은 다음 갱신 때 다시 기록)
+                    print(f"작업 #{job_id}: 진행률을 기록하지 못했습니다 - {str(e)}")
+
+        def on_finished(message):
+            outcome.update(status=STATUS_COMPLETED, message=message)
+
+        def on_error(message):
+            outcome.update(status=STATUS_FAILED, message=message)
+
+        def on_process_started(pid):
+            # 직접 연결된 슬롯에서 예외가 빠져나가면 PyQt가 데몬 프로세스 전체를 종료하므로 여기서 처리
+            try:
+                if post_spawn_limits:
+                    report_skipped_limits(job_id, resource_governor.apply_to_process(pid, post_spawn_limits))
+                if metrics and self.sample_interval > 0:
+                    metrics.start_sampling(pid=pid, interval=self.sample_interval)
+            except Exception as e:
+                print(f"작업 #{job_id}: 자원 제한 / 사용량 기록을 시작하지 못했습니다 - {str(e)}")
+
+        def run_extraction():
+            # 작업마다 새 스레드에서 실행하여 스레드 우선순위가 다음 작업에 남지 않도록 함
+            try:
+                if limits:
+                    report_skipped_limits(job_id, resource_governor.apply_to_current_thread(limits))
+                if metrics and self.sample_interval > 0:
+                    metrics.start_sampling(thread_id=threading.get_native_id(), interval=self.sample_interval)
+            except Exception as e:
+                print(f"작업 #{job_id}: 자원 제한 / 사용량 기록을 시작하지 못했습니다 - {str(e)}")
+            runner.run()
+
+        # 작업 스레드에서 바로 호출되도록 직접 연결 (이벤트 루프 없음)
+        direct = Qt.ConnectionType.DirectConnection
+        runner.progress_updated.connect(on_progress, direct)
+        getattr(runner, finished_signal_name).connect(on_finished, direct)
+        runner.error_occurred.connect(on_error, direct)
+        if job['kind'] == 'convert':
+            runner.process_started.connect(on_process_started, direct)
+
+        with self.jobs_lock:
+            self.running_jobs[job_id] = runner
+        try:
+            if job['kind'] == 'extract':
+                extraction_thread = threading.Thread(target=run_extraction, name=f"job-{job_id}")
+                extraction_thread.start()
+                extraction_thread.join()
+            else:
+                runner.run()
+        finally:
+            with self.jobs_lock:
+                self.running_jobs.pop(job_id, None)
+                cancelled = job_id in self.cancel_requested
+                self.cancel_requested.discard(job_id)
+            if metrics:
+                metrics.stop_sampling()
+                metrics.write_report(self.metrics_dir, f"job_{job_id}")
+
+        if cancelled:
+            status = STATUS_CANCELLED
+            self.queue.finish(job_id, status, "사용자에 의해 취소되었습니다.")
+        elif not self.is_running:
+            # 데몬 종료로 중단된 작업은 다음 실행 때 다시 처리 (합계에는 다시 실행한 결과만 포함)
+            self.queue.update(job_id, status=STATUS_QUEUED, progress=0, started_at=None)
+            return
+        else:
+            status = outcome['status']
+            if status == STATUS_COMPLETED:
+                self.queue.update(job_id, progress=100)
+            self.queue.finish(job_id, status, outcome['message'])
+
+        if metrics:
+            self.metrics_aggregate.add(metrics, status)
+            self.metrics_aggregate.write_prometheus(os.path.join(self.metrics_dir, PROMETHEUS_FILENAME))
+
+
+class EstimateWorker(threading.Thread):
+    """대기 중인 변환 작업의 예상 시간과 출력 크기를 미리 계산 (스케줄링과 용량 계획에 사용)"""
+
+    def __init__(self, job_daemon, poll_interval=2.0):
+        super().__init__(name="estimate-worker", daemon=True)
+        self.job_daemon = job_daemon
+        self.poll_interval = poll_interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            job = self.job_daemon.queue.next_unestimated('convert')
+            if job is None:
+                self.stopped.wait(self.poll_interval)
+                continue
+
+            # 슬롯이 모두 사용 중이면 종료 요청을 확인한 뒤 다시 시도
+            estimate = self.job_daemon.estimate(job['params'], job['resources'], slot_timeout=self.poll_interval)
+            if estimate is None:
+                continue
+            self.job_daemon.queue.set_estimate(job['id'], estimate)
+
+    def stop(self):
+        self.stopped.set()
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """
+    모든 요청에 Authorization: Bearer <토큰> 헤더가 필요하고,
+    POST 요청은 Content-Type: application/json이어야 함 (브라우저의 교차 출처 요청 차단)
+
+    GET  /jobs[?status=...]      작업 목록
+    POST /jobs                   작업 추가 {"kind": "convert" | "extract", "params": {...},
+                                           "resources": {"nice", "ionice", "cpus", "memory_mb"}}
+    GET  /jobs/<id>              작업 상태
+    POST /jobs/<id>/cancel       작업 취소
+    POST /jobs/<id>/pause        작업 일시 정지
+    POST /jobs/<id>/resume       작업 재개
+    GET  /jobs/<id>/events       진행 상황 스트리밍 (줄 단위 JSON)
+    POST /estimates              변환 예상 시간 / 출력 크기 계산 {"params": {...}, "resources": {...}}
+    """
+
+    def do_GET(self):
+        if not self.authorize():
+            return
+        url = urlsplit(self.path)
+        parts = [part for part in url.path.split('/') if part]
+
+        if parts == ['jobs']:
+            status = parse_qs(url.query).get('status', [None])[0]
+            self.send_json(200, self.server.job_daemon.queue.list(status))
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self.get_job(parts[1])
+            if job:
+                self.send_json(200, job)
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'events':
+            job = self.get_job(parts[1])
+            if job:
+                self.stream_events(job['id'])
+        else:
+            self.send_json(404, {'error': "존재하지 않는 경로입니다."})
+
+    def do_POST(self):
+        content_type = self.headers.get('Content-Type', '').split(';')[0].strip().lower()
+        if content_type != 'application/json':
+            self.send_json(415, {'error': "Content-Type은 application/json이어야 합니다."})
+            return
+        if not self.authorize():
+            return
+        parts = [part for part in urlsplit(self.path).path.split('/') if part]
+
+        if parts == ['jobs']:
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                job_id = self.server.job_daemon.submit(
+                    body.get('kind'), body.get('params', {}), body.get('resources'))
+            except (ValueError, TypeError, AttributeError) as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            self.send_json(201, {'id': job_id})
+        elif parts == ['estimates']:
+            try:
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length) or b'{}')
+                params, resources = body.get('params', {}), body.get('resources')
+            except (ValueError, AttributeError) as e:
+                self.send_json(400, {'error': str(e)})
+                return
+            estimate = self.server.job_daemon.estimate(params, resources)
+            self.send_json(400 if 'error' in estimate else 200, estimate)
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'cancel':
+            job = self.get_job(parts[1])
+            if job:
+                if self.server.job_daemon.cancel(job['id']):
+                    self.send_json(200, {'id': job['id'], 'cancelled': True})
+                else:
+                    self.send_json(409, {'error': "이미 종료된 작업입니다."})
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] in ('pause', 'resume'):
+            job = self.get_job(parts[1])
+            if job:
+                action = getattr(self.server.job_daemon, parts[2])
+                if action(job['id']):
+                    job = self.server.job_daemon.queue.get(job['id'])
+                    self.send_json(200, {'id': job['id'], 'status': job['status']})
+                else:
+                    self.send_json(409, {'error': "실행 중인 작업이 아니거나 지원하지 않는 작업입니다."})
+        else:
+            self.send_json(404, {'error': "존재하지 않는 경로입니다."})
+
+    def authorize(self):
+        """토큰이 맞지 않으면 401 응답 후 False 반환"""
+        expected = f"Bearer {self.server.token}".encode('utf-8')
+        if not hmac.compare_digest(self.headers.get('Authorization', '').encode('utf-8'), expected):
+            self.send_json(401, {'error': "인증 토큰이 올바르지 않습니다."})
+            return False
+        return True
+
+    def get_job(self, job_id_text):
+        job = None
+        if job_id_text.isdigit():
+            job = self.server.job_daemon.queue.get(int(job_id_text))
+        if job is None:
+            self.send_json(404, {'error': "작업을 찾을 수 없습니다."})
+        return job
+
+    def stream_events(self, job_id):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        last_snapshot = None
+        try:
+            while True:
+                job = self.server.job_daemon.queue.get(job_id)
+                snapshot = (job['status'], job['progress'], job['message'])
+                if snapshot != last_snapshot:
+                    event = {'id': job_id, 'status': job['status'],
+                             'progress': job['progress'], 'message': job['message']}
+                    self.wfile.write(json.dumps(event, ensure_ascii=False).encode('utf-8') + b'\n')
+                    self.wfile.flush()
+                    last_snapshot = snapshot
+                if job['status'] in FINISHED_STATUSES:
+                    break
+                time.sleep(EVENT_POLL_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # 클라이언트가 연결을 끊은 경우 무시
+
+    def send_json(self, status_code, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비디오 변환 / 프레임 추출 작업 데몬")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="작업 대기열 SQLite 파일 경로")
+    parser.add_argument('--workers', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="동시에 실행할 작업 수")
+    parser.add_argument('--watch-config', help="감시 폴더 설정 JSON 파일 경로")
+    parser.add_argument('--poll-interval', type=float, default=2.0, help="감시 폴더 검사 간격 (초)")
+    parser.add_argument('--settle-time', type=float, default=3.0,
+                        help="파일 크기와 수정 시각이 이 시간 동안 변하지 않으면 쓰기 완료로 판단 (초)")
+    parser.add_argument('--nice', type=int, help="작업 기본 nice 값 (0 ~ 19)")
+    parser.add_argument('--ionice', type=int, help="작업 기본 I/O 우선순위 (best-effort 0 ~ 7)")
+    parser.add_argument('--cpus', help="작업이 사용할 CPU 목록 (예: 0-3,6)")
+    parser.add_argument('--memory-mb', type=int, help="변환(FFmpeg) 프로세스 메모리 상한 (MB)")
+    parser.add_argument('--estimate', action='store_true',
+                        help="대기 중인 변환 작업의 예상 시간을 샘플 구간 변환으로 미리 계산")
+    parser.add_argument('--schedule', choices=sorted(SCHEDULE_ORDERS), default='fifo',
+                        help="작업 실행 순서 (shortest는 --estimate와 함께 사용)")
+    parser.add_argument('--metrics-dir', help="작업별 성능 보고서(JSON)와 전체 합계(Prometheus 텍스트) 저장 폴더")
+    parser.add_argument('--sample-interval', type=float, default=1.0,
+                        help="CPU / 메모리 사용량 기록 간격 (초, 0이면 기록 안 함)")
+    args = parser.parse_args()
+
+    default_limits = {}
+    if args.nice is not None:
+        default_limits['nice'] = args.nice
+    if args.ionice is not None:
+        default_limits['ionice'] = args.ionice
+    if args.cpus:
+        default_limits['cpus'] = args.cpus
+    if args.memory_mb:
+        default_limits['memory_mb'] = args.memory_mb
+    try:
+        default_limits = resource_governor.validate_limits(default_limits)
+    except ValueError as e:
+        parser.error(str(e))
+
+    folders = load_watch_config(args.watch_config) if args.watch_config else []
+
+    db_dir = os.path.dirname(os.path.abspath(args.db))
+    os.makedirs(db_dir, exist_ok=True)
+    token_path = os.path.join(db_dir, TOKEN_FILENAME)
+    token = load_or_create_token(token_path)
+    queue = JobQueue(args.db, args.schedule)
+    job_daemon = JobDaemon(queue, args.workers, default_limits, args.metrics_dir, args.sample_interval)
+    job_daemon.start()
+
+    estimate_worker = None
+    if args.estimate:
+        estimate_worker = EstimateWorker(job_daemon)
+        estimate_worker.start()
+
+    folder_watcher = None
+    if folders:
+        folder_watcher = FolderWatcher(job_daemon, folders, args.poll_interval, args.settle_time)
+        folder_watcher.start()
+
+    server = ThreadingHTTPServer((args.host, args.port), JobRequestHandler)
+    server.daemon_threads = True
+    server.job_daemon = job_daemon
+    server.token = token
+    print(f"작업 데몬 실행 중: http://{args.host}:{args.port} (작업자 {args.workers}개, DB: {args.db})")
+    print(f"API 토큰 파일: {token_path}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if folder_watcher:
+            folder_watcher.stop()
+            folder_watcher.join()
+        if estimate_worker:
+            estimate_worker.stop()
+            estimate_worker.join()
+        job_daemon.stop()
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()
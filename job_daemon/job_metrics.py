@@ -0,0 +1,227 @@
+import os
+import json
+import time
+import threading
+
+
+# 단계 이름
+#   decode      프레임 디코딩 (cap.grab)
+#   seek        목표 시각으로 탐색 (cap.set)
+#   retrieve    디코딩된 프레임을 이미지로 변환 (cap.retrieve)
+#   encode      이미지 인코딩 (cv2.imencode)
+#   write       이미지 파일 쓰기
+#   queue_wait  작업 대기열에서 기다린 시간
+#   subprocess  FFmpeg 프로세스 실행 시간
+
+# 단계별 소요 시간 히스토그램 구간 (초)
+HISTOGRAM_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                     1, 2.5, 5, 10, 30, 60, 300, float('inf'))
+
+COUNTER_NAMES = ('frames_decoded', 'frames_written', 'bytes_written')
+
+CLOCK_TICKS = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+
+
+class StageHistogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.bucket_counts = [0] * len(HISTOGRAM_BUCKETS)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.minimum = seconds if self.minimum is None else min(self.minimum, seconds)
+        self.maximum = seconds if self.maximum is None else max(self.maximum, seconds)
+        for index, upper_bound in enumerate(HISTOGRAM_BUCKETS):
+            if seconds <= upper_bound:
+                self.bucket_counts[index] += 1
+                break
+
+    def merge(self, other):
+        self.count += other.count
+        self.total += other.total
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                self.minimum = value if self.minimum is None else min(self.minimum, value)
+                self.maximum = value if self.maximum is None else max(self.maximum, value)
+        self.bucket_counts = [a + b for a, b in zip(self.bucket_counts, other.bucket_counts)]
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'sum': round(self.total, 6),
+            'mean': round(self.total / self.count, 6) if self.count else None,
+            'min': self.minimum,
+            'max': self.maximum,
+            'buckets': {str(bound): count for bound, count in zip(HISTOGRAM_BUCKETS, self.bucket_counts)},
+        }
+
+
+class JobMetrics:
+    """작업 하나의 단계별 시간, 처리량, CPU / 메모리 사용량 기록"""
+
+    def __init__(self, job_id=None, kind=None):
+        self.job_id = job_id
+        self.kind = kind
+        self.stages = {}
+        self.counters = dict.fromkeys(COUNTER_NAMES, 0)
+        self.resource_samples = []  # (경과 시간, CPU %, RSS MB)
+        self.lock = threading.Lock()
+        self.sampling_stopped = threading.Event()
+        self.sampler = None
+
+    def observe(self, stage, seconds):
+        with self.lock:
+            if stage not in self.stages:
+                self.stages[stage] = StageHistogram()
+            self.stages[stage].observe(seconds)
+
+    def add(self, counter, value=1):
+        with self.lock:
+            self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def start_sampling(self, pid=None, thread_id=None, interval=1.0):
+        """
+        /proc 정보로 CPU와 메모리 사용량을 주기적으로 기록 (Linux 전용)
+        thread_id가 있으면 CPU는 해당 스레드 기준, 메모리는 프로세스 전체 기준
+        """
+        self.stop_sampling()
+        pid = pid or os.getpid()
+        stat_path = f"/proc/{pid}/task/{thread_id}/stat" if thread_id else f"/proc/{pid}/stat"
+        if not os.path.exists(stat_path):
+            return
+
+        self.sampling_stopped.clear()
+        self.sampler = threading.Thread(target=self._sample_loop, args=(pid, stat_path, interval),
+                                        name="metrics-sampler", daemon=True)
+        self.sampler.start()
+
+    def stop_sampling(self):
+        if self.sampler:
+            self.sampling_stopped.set()
+            self.sampler.join()
+            self.sampler = None
+
+    def _sample_loop(self, pid, stat_path, interval):
+        start = time.perf_counter()
+        previous_time, previous_ticks = start, self._read_cpu_ticks(stat_path)
+        while not self.sampling_stopped.wait(interval):
+            now, ticks = time.perf_counter(), self._read_cpu_ticks(stat_path)
+            rss_mb = self._read_rss_mb(pid)
+            if ticks is None or rss_mb is None:
+                break  # 프로세스 또는 스레드 종료
+            cpu_percent = (ticks - previous_ticks) / CLOCK_TICKS / (now - previous_time) * 100
+            with self.lock:
+                self.resource_samples.append((round(now - start, 3), round(cpu_percent, 1), rss_mb))
+            previous_time, previous_ticks = now, ticks
+
+    @staticmethod
+    def _read_cpu_ticks(stat_path):
+        try:
+            with open(stat_path) as f:
+                # 프로세스 이름에 공백이 있을 수 있으므로 ')' 이후부터 분리
+                fields = f.read().rsplit(')', 1)[1].split()
+            return int(fields[11]) + int(fields[12])  # utime + stime
+        except (OSError, IndexError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_rss_mb(pid):
+        try:
+            with open(f"/proc/{pid}/status") as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        return round(int(line.split()[1]) / 1024, 1)
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def to_dict(self):
+        with self.lock:
+            cpu_values = [sample[1] for sample in self.resource_samples]
+            rss_values = [sample[2] for sample in self.resource_samples]
+            return {
+                'job_id': self.job_id,
+                'kind': self.kind,
+                'stages': {name: histogram.to_dict() for name, histogram in self.stages.items()},
+                'counters': dict(self.counters),
+                'resources': {
+                    'samples': list(self.resource_samples),
+                    'cpu_percent_mean': round(sum(cpu_values) / len(cpu_values), 1) if cpu_values else None,
+                    'cpu_percent_max': max(cpu_values) if cpu_values else None,
+                    'rss_mb_max': max(rss_values) if rss_values else None,
+                },
+            }
+
+    def write_report(self, directory, basename):
+        """작업별 JSON 보고서를 저장하고 경로를 반환"""
+        os.makedirs(directory, exist_ok=True)
+        json_path = os.path.join(directory, f"{basename}.json")
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return json_path
+
+
+class MetricsAggregate:
+    """
+    끝난 작업들의 단계별 시간과 처리량을 작업 종류별로 합산
+    Prometheus 텍스트 파일 하나로 내보내므로 작업 수가 늘어도 시계열 수는 일정함 (작업별 상세는 JSON 보고서)
+    """
+
+    def __init__(self):
+        self.stages = {}  # (kind, stage) -> StageHistogram
+        self.counters = {}  # (kind, counter) -> 합계
+        self.job_counts = {}  # (kind, status) -> 끝난 작업 수
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+
+    def add(self, metrics, status):
+        with metrics.lock, self.lock:
+            key = (metrics.kind, status)
+            self.job_counts[key] = self.job_counts.get(key, 0) + 1
+            for name, histogram in metrics.stages.items():
+                self.stages.setdefault((metrics.kind, name), StageHistogram()).merge(histogram)
+            for name, value in metrics.counters.items():
+                key = (metrics.kind, name)
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식 (node_exporter textfile collector 등에서 수집)"""
+        lines = [
+            "# HELP dabin_jobs_total Finished jobs by kind and final status.",
+            "# TYPE dabin_jobs_total counter",
+        ]
+        with self.lock:
+            for (kind, status), count in sorted(self.job_counts.items()):
+                lines.append(f'dabin_jobs_total{{kind="{kind}",status="{status}"}} {count}')
+
+            lines.append("# HELP dabin_stage_seconds Time spent in each processing stage.")
+            lines.append("# TYPE dabin_stage_seconds histogram")
+            for (kind, stage), histogram in sorted(self.stages.items()):
+                labels = f'kind="{kind}",stage="{stage}"'
+                cumulative = 0
+                for bound, count in zip(HISTOGRAM_BUCKETS, histogram.bucket_counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else repr(float(bound))
+                    lines.append(f'dabin_stage_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f"dabin_stage_seconds_sum{{{labels}}} {histogram.total}")
+                lines.append(f"dabin_stage_seconds_count{{{labels}}} {histogram.count}")
+
+            for counter in COUNTER_NAMES:
+                lines.append(f"# TYPE dabin_{counter}_total counter")
+                for (kind, name), value in sorted(self.counters.items()):
+                    if name == counter:
+                        lines.append(f'dabin_{counter}_total{{kind="{kind}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # 수집기가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        # 작업자 스레드가 동시에 쓰더라도 이전 합계가 나중 합계를 덮어쓰지 않도록 잠금 안에서 구성
+        with self.write_lock:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            os.replace(path + '.tmp', path)
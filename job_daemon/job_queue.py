@@ -0,0 +1,184 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_PAUSED = 'paused'
+STATUS_COMPLETED = 'completed'
+STATUS_FAILED = 'failed'
+STATUS_CANCELLED = 'cancelled'
+
+FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED)
+
+# 다음에 실행할 작업을 고르는 순서
+#   fifo      추가된 순서
+#   shortest  예상 변환 시간이 짧은 순서
+#             예상 시간이 없는 작업(계산 전, 계산 실패, 프레임 추출)은 예상 시간이 있는 작업 뒤에 추가된 순서로 실행
+SCHEDULE_ORDERS = {
+    'fifo': "id",
+    'shortest': "estimated_seconds IS NULL, estimated_seconds, id",
+}
+
+# 이전 버전에서 만든 DB에 추가할 열
+ADDED_COLUMNS = {
+    'resources': "TEXT NOT NULL DEFAULT '{}'",
+    'estimate': "TEXT",
+    'estimated_seconds': "REAL",
+}
+
+
+class JobQueue:
+    """SQLite 파일에 저장되는 작업 대기열 (데몬 재시작 후에도 유지)"""
+
+    def __init__(self, db_path, schedule='fifo'):
+        self.db_path = db_path
+        self.schedule_order = SCHEDULE_ORDERS[schedule]
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        with self.lock, self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    resources TEXT NOT NULL DEFAULT '{}',
+                    estimate TEXT,
+                    estimated_seconds REAL,
+                    status TEXT NOT NULL,
+                    progress INTEGER NOT NULL DEFAULT 0,
+                    message TEXT NOT NULL DEFAULT '',
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    finished_at REAL
+                )
+                """
+            )
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ingested_files (
+                    path TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime REAL NOT NULL,
+                    ingested_at REAL NOT NULL,
+                    PRIMARY KEY (path, size, mtime)
+                )
+                """
+            )
+            # 이전 버전에서 만든 DB에 추가된 열 보완
+            columns = [row['name'] for row in self.connection.execute("PRAGMA table_info(jobs)")]
+            for name, definition in ADDED_COLUMNS.items():
+                if name not in columns:
+                    self.connection.execute(f"ALTER TABLE jobs ADD COLUMN {name} {definition}")
+
+            # 이전 실행에서 중단된 작업은 처음부터 다시 실행
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, progress = 0, started_at = NULL WHERE status IN (?, ?)",
+                (STATUS_QUEUED, STATUS_RUNNING, STATUS_PAUSED)
+            )
+
+    def submit(self, kind, params, resources=None):
+        with self.lock, self.connection:
+            return self._insert_job(kind, params, resources)
+
+    def submit_ingested(self, path, size, mtime, jobs):
+        """
+        감시 폴더 파일의 작업들을 처리 기록과 함께 한 트랜잭션으로 추가하고 작업 번호 목록을 반환
+        이미 기록된 파일이면 None (작업 추가 도중 실패하면 처리 기록도 남지 않음)
+        """
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO ingested_files (path, size, mtime, ingested_at) VALUES (?, ?, ?, ?)",
+                (path, size, mtime, time.time())
+            )
+            if cursor.rowcount == 0:
+                return None
+            return [self._insert_job(kind, params, resources) for kind, params, resources in jobs]
+
+    def claim_next(self):
+        """스케줄 순서상 첫 번째 대기 작업을 실행 상태로 바꾸고 반환 (없으면 None)"""
+        with self.lock, self.connection:
+            row = self.connection.execute(
+                f"SELECT * FROM jobs WHERE status = ? ORDER BY {self.schedule_order} LIMIT 1", (STATUS_QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (STATUS_RUNNING, time.time(), row['id'])
+            )
+        return self.get(row['id'])
+
+    def update(self, job_id, **fields):
+        if not fields:
+            return
+        columns = ', '.join(f"{name} = ?" for name in fields)
+        with self.lock, self.connection:
+            self.connection.execute(
+                f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id)
+            )
+
+    def finish(self, job_id, status, message):
+        self.update(job_id, status=status, message=message, finished_at=time.time())
+
+    def next_unestimated(self, kind):
+        """예상 시간을 아직 계산하지 않은 가장 오래된 대기 작업"""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT * FROM jobs WHERE status = ? AND kind = ? AND estimate IS NULL ORDER BY id LIMIT 1",
+                (STATUS_QUEUED, kind)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def set_estimate(self, job_id, estimate):
+        self.update(job_id, estimate=json.dumps(estimate, ensure_ascii=False),
+                    estimated_seconds=estimate.get('estimated_seconds'))
+
+    def cancel_if_queued(self, job_id):
+        """대기 중인 작업이면 바로 취소 처리하고 True 반환"""
+        with self.lock, self.connection:
+            cursor = self.connection.execute(
+                "UPDATE jobs SET status = ?, finished_at = ? WHERE id = ? AND status = ?",
+                (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED)
+            )
+            return cursor.rowcount > 0
+
+    def get(self, job_id):
+        with self.lock:
+            row = self.connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list(self, status=None):
+        with self.lock:
+            if status:
+                rows = self.connection.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY id", (status,)
+                ).fetchall()
+            else:
+                rows = self.connection.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+    def _insert_job(self, kind, params, resources):
+        # self.lock과 트랜잭션 안에서 호출
+        cursor = self.connection.execute(
+            "INSERT INTO jobs (kind, params, resources, status, created_at) VALUES (?, ?, ?, ?, ?)",
+            (kind, json.dumps(params, ensure_ascii=False), json.dumps(resources or {}),
+             STATUS_QUEUED, time.time())
+        )
+        return cursor.lastrowid
+
+    @staticmethod
+    def _row_to_job(row):
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['resources'] = json.loads(job['resources'])
+        job['estimate'] = json.loads(job['estimate']) if job['estimate'] else None
+        return job
@@ -0,0 +1,211 @@
+import os
+import ctypes
+import ctypes.util
+import shutil
+import platform
+import threading
+import subprocess
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# 작업별 자원 제한 항목
+#   nice       프로세스 우선순위 (0 ~ 19, 클수록 양보)
+#   ionice     디스크 I/O 우선순위 (best-effort 0 ~ 7, 클수록 양보)
+#   cpus       사용할 CPU 번호 목록
+#   memory_mb  주소 공간 상한 (MB, 서브프로세스에만 적용)
+RESOURCE_KEYS = ('nice', 'ionice', 'cpus', 'memory_mb')
+
+# ioprio_set 시스템 콜 (linux/ioprio.h)
+IOPRIO_SYSCALL_NUMBERS = {'x86_64': 251, 'aarch64': 30, 'i686': 289, 'i386': 289}
+IOPRIO_WHO_PROCESS = 1
+IOPRIO_CLASS_BE = 2
+IOPRIO_CLASS_SHIFT = 13
+
+# Windows에서 이 값 이상의 nice는 IDLE_PRIORITY_CLASS, 그보다 작은 양수는 BELOW_NORMAL_PRIORITY_CLASS로 실행
+WINDOWS_IDLE_NICE = 10
+
+_io_priority_syscall = None  # (libc, 시스템 콜 번호), 처음 사용할 때 로드
+
+
+def parse_cpu_list(text):
+    """'0-3,6' 형식의 CPU 목록 문자열을 번호 목록으로 변환 (형식이 잘못되면 ValueError)"""
+    cpus = []
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            if '-' in part:
+                start, end = part.split('-')
+                cpus.extend(range(int(start), int(end) + 1))
+            else:
+                cpus.append(int(part))
+        except ValueError:
+            raise ValueError(f"잘못된 CPU 목록 형식: {text}")
+    return cpus
+
+
+def validate_limits(limits):
+    """자원 제한 항목을 검사하고 정규화한 사본을 반환 (잘못된 값이면 ValueError)"""
+    if not isinstance(limits, dict):
+        raise ValueError("자원 제한은 객체 형식이어야 합니다.")
+    unknown = set(limits) - set(RESOURCE_KEYS)
+    if unknown:
+        raise ValueError(f"알 수 없는 자원 제한 항목: {', '.join(sorted(unknown))}")
+
+    normalized = {}
+    if 'nice' in limits:
+        if not _is_int(limits['nice']) or not 0 <= limits['nice'] <= 19:
+            raise ValueError("nice 값은 0 ~ 19 사이의 정수여야 합니다.")
+        normalized['nice'] = limits['nice']
+    if 'ionice' in limits:
+        if not _is_int(limits['ionice']) or not 0 <= limits['ionice'] <= 7:
+            raise ValueError("ionice 값은 0 ~ 7 사이의 정수여야 합니다.")
+        normalized['ionice'] = limits['ionice']
+    if 'cpus' in limits:
+        cpus = limits['cpus']
+        if isinstance(cpus, str):
+            cpus = parse_cpu_list(cpus)
+        if not isinstance(cpus, list) or not all(_is_int(cpu) and cpu >= 0 for cpu in cpus):
+            raise ValueError("cpus는 0 이상의 CPU 번호 목록 또는 '0-3,6' 형식의 문자열이어야 합니다.")
+        if not cpus:
+            raise ValueError("cpus 목록이 비어 있습니다.")
+        normalized['cpus'] = sorted(set(cpus))
+    if 'memory_mb' in limits:
+        if not _is_int(limits['memory_mb']) or limits['memory_mb'] <= 0:
+            raise ValueError("memory_mb 값은 0보다 큰 정수여야 합니다.")
+        normalized['memory_mb'] = limits['memory_mb']
+    return normalized
+
+
+def _is_int(value):
+    # JSON의 true / false는 bool이지만 int의 하위 클래스이므로 제외
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def build_launch_options(limits):
+    """
+    서브프로세스(ffmpeg)를 처음부터 제한된 상태로 실행하기 위한 (명령어 앞에 붙일 목록, Popen creationflags,
+    실행 직후 apply_to_process로 적용할 나머지 항목)을 반환
+
+    POSIX에서는 nice / ionice / taskset / prlimit 명령으로 감싸서 실행 (각 명령이 exec하므로 PID는 ffmpeg와 같음)
+    작업 데몬은 여러 스레드로 동작하므로 fork와 exec 사이에 파이썬 코드를 실행하는 preexec_fn은 사용하지 않음
+    Windows에서는 nice 값을 프로세스 우선순위 클래스로 바꿔 지정
+    해당 명령이 없는 항목은 실행 직후에 적용되므로 시작 직후의 짧은 구간 동안은 제한 없이 실행될 수 있음
+    """
+    prefix = []
+    creationflags = 0
+    remaining = dict(limits)
+
+    if os.name == 'nt':
+        nice = remaining.pop('nice', 0)
+        if nice >= WINDOWS_IDLE_NICE:
+            creationflags = subprocess.IDLE_PRIORITY_CLASS
+        elif nice > 0:
+            creationflags = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+        return prefix, creationflags, remaining
+
+    if 'memory_mb' in remaining and shutil.which('prlimit'):
+        limit_bytes = remaining.pop('memory_mb') * 1024 * 1024
+        prefix.extend(['prlimit', f"--as={limit_bytes}"])
+    if 'nice' in remaining and shutil.which('nice'):
+        prefix.extend(['nice', '-n', str(remaining.pop('nice'))])
+    if 'ionice' in remaining and shutil.which('ionice'):
+        prefix.extend(['ionice', '-c', str(IOPRIO_CLASS_BE), '-n', str(remaining.pop('ionice'))])
+    if 'cpus' in remaining and shutil.which('taskset'):
+        prefix.extend(['taskset', '-c', ','.join(str(cpu) for cpu in remaining.pop('cpus'))])
+    return prefix, creationflags, remaining
+
+
+def apply_to_process(pid, limits):
+    """
+    실행 중인 서브프로세스(ffmpeg)에 자원 제한을 적용 (build_launch_options로 지정하지 못한 항목용)
+    지원하지 않는 항목은 건너뛰고 적용하지 못한 항목의 설명 목록을 반환
+    """
+    skipped = []
+    # Linux에서 nice / ionice / affinity는 스레드 단위이므로 이미 생성된 스레드에도 모두 적용
+    for thread_id in _process_thread_ids(pid):
+        _apply_common(thread_id, limits, skipped)
+
+    if 'memory_mb' in limits:
+        limit_bytes = int(limits['memory_mb']) * 1024 * 1024
+        if resource is not None and hasattr(resource, 'prlimit'):
+            try:
+                resource.prlimit(pid, resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+            except OSError as e:
+                skipped.append(f"memory_mb ({str(e)})")
+        else:
+            skipped.append("memory_mb (지원하지 않는 플랫폼)")
+    return list(dict.fromkeys(skipped))
+
+
+def apply_to_current_thread(limits):
+    """
+    현재 작업 스레드에 자원 제한을 적용 (Linux는 스레드 단위로 nice / ionice / affinity 지정 가능)
+    메모리 상한은 프로세스 전체에 걸리므로 스레드에는 적용하지 않음
+    """
+    skipped = []
+    _apply_common(threading.get_native_id(), limits, skipped)
+    if 'memory_mb' in limits:
+        skipped.append("memory_mb (프레임 추출 작업에는 적용되지 않음)")
+    return skipped
+
+
+def _process_thread_ids(pid):
+    try:
+        return [int(name) for name in os.listdir(f"/proc/{pid}/task")]
+    except OSError:
+        return [pid]
+
+
+def _apply_common(target_id, limits, skipped):
+    if 'nice' in limits:
+        if hasattr(os, 'setpriority'):
+            try:
+                os.setpriority(os.PRIO_PROCESS, target_id, int(limits['nice']))
+            except OSError as e:
+                skipped.append(f"nice ({str(e)})")
+        else:
+            skipped.append("nice (지원하지 않는 플랫폼)")
+
+    if 'ionice' in limits:
+        error = _set_io_priority(target_id, int(limits['ionice']))
+        if error:
+            skipped.append(f"ionice ({error})")
+
+    if 'cpus' in limits:
+        if hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(target_id, limits['cpus'])
+            except OSError as e:
+                skipped.append(f"cpus ({str(e)})")
+        else:
+            skipped.append("cpus (지원하지 않는 플랫폼)")
+
+
+def _load_io_priority_syscall():
+    """ioprio_set 호출에 쓸 (libc, 시스템 콜 번호) - 지원하지 않는 플랫폼이면 None"""
+    global _io_priority_syscall
+    syscall_number = IOPRIO_SYSCALL_NUMBERS.get(platform.machine())
+    if platform.system() != 'Linux' or syscall_number is None:
+        return None
+    if _io_priority_syscall is None:
+        _io_priority_syscall = (ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True), syscall_number)
+    return _io_priority_syscall
+
+
+def _set_io_priority(target_id, level):
+    """best-effort 클래스로 I/O 우선순위를 지정 (실패 시 오류 설명 반환)"""
+    loaded = _io_priority_syscall or _load_io_priority_syscall()
+    if loaded is None:
+        return "지원하지 않는 플랫폼"
+
+    libc, syscall_number = loaded
+    priority = (IOPRIO_CLASS_BE << IOPRIO_CLASS_SHIFT) | level
+    if libc.syscall(syscall_number, IOPRIO_WHO_PROCESS, target_id, priority) != 0:
+        return os.strerror(ctypes.get_errno())
+    return None
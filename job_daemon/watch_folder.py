@@ -0,0 +1,220 @@
+import os
+import json
+import time
+import select
+import ctypes
+import ctypes.util
+import platform
+import threading
+
+
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v')
+
+# inotify 이벤트 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+
+
+def load_watch_config(config_path):
+    """
+    감시 폴더 설정 파일을 읽어 폴더 목록을 반환
+
+    [
+        {
+            "path": "D:/capture/inbox",
+            "convert": {"output_dir": "D:/capture/converted", "output_format": "mp4",
+                        "pixel_format": "yuv420p", "width": 1280, "height": 720,
+                        "scale_mode": "aspect_fit"},
+            "extract": {"output_dir": "D:/capture/frames", "sample_mode": "interval",
+                        "interval": 2, "extract_all": false, "custom_fps": 1}
+        }
+    ]
+    """
+    with open(config_path, encoding='utf-8') as f:
+        folders = json.load(f)
+
+    for folder in folders:
+        folder['path'] = os.path.abspath(folder['path'])
+        if 'convert' not in folder and 'extract' not in folder:
+            raise ValueError(f"감시 폴더에 convert 또는 extract 설정이 없습니다: {folder['path']}")
+        for preset in (folder.get('convert'), folder.get('extract')):
+            # 출력 파일이 다시 감시 대상이 되지 않도록 같은 폴더는 금지
+            if preset and os.path.abspath(preset['output_dir']) == folder['path']:
+                raise ValueError(f"출력 폴더는 감시 폴더와 달라야 합니다: {folder['path']}")
+    return folders
+
+
+def build_job_params(kind, preset, file_path):
+    """감시 폴더 프리셋과 입력 파일로 작업 인자를 구성"""
+    filename_without_ext = os.path.splitext(os.path.basename(file_path))[0]
+
+    if kind == 'convert':
+        output_format = preset.get('output_format', 'mp4')
+        return {
+            'input_path': file_path,
+            'output_path': os.path.join(preset['output_dir'], f"{filename_without_ext}_converted.{output_format}"),
+            'output_format': output_format,
+            'pixel_format': preset.get('pixel_format', "원본 유지"),
+            'width': preset.get('width', 0),
+            'height': preset.get('height', 0),
+            'scale_mode': preset.get('scale_mode', 'aspect_fit'),
+        }
+
+    # 파일마다 별도 폴더에 프레임 저장 (frame_000.jpg 이름 충돌 방지)
+    return {
+        'video_path': file_path,
+        'output_dir': os.path.join(preset['output_dir'], filename_without_ext),
+        'interval': preset.get('interval', 1),
+        'extract_all': preset.get('extract_all', False),
+        'custom_fps': preset.get('custom_fps', 1),
+        'sample_mode': preset.get('sample_mode', 'fps'),
+    }
+
+
+class InotifyWaiter:
+    """Linux inotify로 폴더 변경 시 즉시 깨어나는 대기 객체"""
+
+    def __init__(self, paths):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        for path in paths:
+            if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+                os.close(self.fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {path}")
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            # 이벤트 내용은 쓰지 않고 폴더를 다시 검사하므로 버퍼만 비움
+            try:
+                while os.read(self.fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWaiter:
+    """inotify를 쓸 수 없는 환경에서 일정 간격으로 폴더를 검사"""
+
+    def wait(self, timeout):
+        time.sleep(timeout)
+
+    def close(self):
+        pass
+
+
+class FolderWatcher(threading.Thread):
+    def __init__(self, job_daemon, folders, poll_interval=2.0, settle_time=3.0):
+        super().__init__(name="folder-watcher", daemon=True)
+        self.job_daemon = job_daemon
+        self.folders = folders
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.pending = {}  # path -> (size, mtime, 변화가 없기 시작한 시각)
+        self.ingested = {}  # path -> 대기열에 추가한 시점의 (size, mtime)
+        self.is_running = True
+
+    def run(self):
+        paths = [folder['path'] for folder in self.folders]
+        for path in paths:
+            os.makedirs(path, exist_ok=True)
+
+        waiter = PollingWaiter()
+        if platform.system() == 'Linux':
+            try:
+                waiter = InotifyWaiter(paths)
+            except OSError as e:
+                print(f"inotify를 사용할 수 없어 폴링으로 감시합니다: {str(e)}")
+
+        try:
+            while self.is_running:
+                for folder in self.folders:
+                    try:
+                        self.scan_folder(folder)
+                    except Exception as e:
+                        # 예상하지 못한 오류로 감시가 멈추지 않도록 기록만 하고 계속 실행
+                        print(f"감시 폴더 검사 중 오류 발생: {folder['path']} ({str(e)})")
+                # 쓰기 중인 파일이 있으면 안정 여부를 확인할 수 있도록 짧게 대기
+                timeout = min(self.poll_interval, self.settle_time) if self.pending else self.poll_interval
+                waiter.wait(timeout)
+        finally:
+            waiter.close()
+
+    def stop(self):
+        self.is_running = False
+
+    def scan_folder(self, folder):
+        now = time.time()
+        try:
+            entries = list(os.scandir(folder['path']))
+        except OSError as e:
+            print(f"감시 폴더를 읽을 수 없습니다: {folder['path']} ({str(e)})")
+            return
+
+        present = set()
+        for entry in entries:
+            try:
+                if not entry.is_file() or not entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                    continue
+                present.add(entry.path)
+                self.check_file(folder, entry, now)
+            except Exception as e:
+                # 파일 하나의 오류(삭제, DB 오류 등)가 다른 파일 처리를 막지 않도록 기록만 함
+                print(f"감시 폴더 파일을 처리할 수 없습니다: {entry.path} ({str(e)})")
+
+        # 사라진 파일은 대기 목록과 처리 기록에서 제거 (같은 경로에 다시 생기면 새 파일로 처리)
+        for tracked in (self.pending, self.ingested):
+            for path in list(tracked):
+                if os.path.dirname(path) == folder['path'] and path not in present:
+                    del tracked[path]
+
+    def check_file(self, folder, entry, now):
+        try:
+            stat = entry.stat()
+        except OSError:
+            return  # 검사 도중 삭제되거나 이동된 파일
+
+        state = (stat.st_size, stat.st_mtime)
+        if self.ingested.get(entry.path) == state:
+            return
+
+        previous = self.pending.get(entry.path)
+        if previous is None or previous[:2] != state:
+            # 새 파일이거나 아직 쓰는 중 - 크기와 수정 시각이 멈출 때까지 대기
+            self.pending[entry.path] = (*state, now)
+            return
+
+        if stat.st_size > 0 and now - previous[2] >= self.settle_time:
+            del self.pending[entry.path]
+            self.ingest(folder, entry.path, *state)
+
+    def ingest(self, folder, file_path, size, mtime):
+        jobs = []
+        for kind in ('convert', 'extract'):
+            preset = folder.get(kind)
+            if not preset:
+                continue
+            params = build_job_params(kind, preset, file_path)
+            try:
+                self.job_daemon.validate(kind, params)
+            except ValueError as e:
+                print(f"감시 폴더 파일을 추가할 수 없습니다: {file_path} ({str(e)})")
+                continue
+            jobs.append((kind, params))
+
+        # 추가할 작업이 없으면 DB에 기록하지 않음 (파일이 바뀌면 다시 시도)
+        job_ids = self.job_daemon.submit_ingested(file_path, size, mtime, jobs) if jobs else []
+        self.ingested[file_path] = (size, mtime)
+        if job_ids is None:
+            return  # 이미 대기열에 추가했던 파일
+
+        for (kind, _), job_id in zip(jobs, job_ids):
+            print(f"감시 폴더 파일 추가: {file_path} -> 작업 #{job_id} ({kind})")
@@ -0,0 +1,89 @@
+import os
+import json
+import urllib.request
+import urllib.error
+
+
+# 작업 데몬 기본 주소와 데이터 폴더 (job_daemon/job_daemon.py도 같은 값을 사용)
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DAEMON_DIR = os.path.join(os.path.expanduser('~'), '.dabin')
+# API 토큰 파일 이름 (데몬이 DB와 같은 폴더에 만듦)
+TOKEN_FILENAME = 'daemon_token'
+
+DAEMON_URL = os.environ.get('DABIN_DAEMON_URL', f"http://{DEFAULT_HOST}:{DEFAULT_PORT}")
+DAEMON_TOKEN_PATH = os.environ.get('DABIN_DAEMON_TOKEN_FILE', os.path.join(DAEMON_DIR, TOKEN_FILENAME))
+
+REQUEST_TIMEOUT = 5.0
+# 진행 상황 스트림에서 이 시간 동안 변화가 없으면 TimeoutError (호출한 쪽에서 중지 요청을 확인할 수 있도록)
+EVENT_READ_TIMEOUT = 1.0
+
+# 작업 상태 표시 이름 (job_daemon/job_queue.py의 STATUS_*)
+STATUS_LABELS = {
+    'queued': "대기 중",
+    'running': "실행 중",
+    'paused': "일시 정지",
+    'completed': "완료",
+    'failed': "실패",
+    'cancelled': "취소됨",
+}
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+def submit_to_daemon(kind, params):
+    """
+    작업 데몬의 대기열에 작업을 추가하고 작업 번호를 반환
+    데몬 오류는 RuntimeError, 연결 실패는 OSError로 전달 (아래 함수들도 동일)
+    """
+    try:
+        return request_daemon('POST', '/jobs', {'kind': kind, 'params': params})['id']
+    except (KeyError, TypeError):
+        raise RuntimeError("작업 데몬의 응답을 해석할 수 없습니다.")
+
+
+def cancel_daemon_job(job_id):
+    request_daemon('POST', f"/jobs/{job_id}/cancel", {})
+
+
+def stream_daemon_job_events(job_id, timeout=EVENT_READ_TIMEOUT):
+    """작업의 상태가 바뀔 때마다 {'id', 'status', 'progress', 'message'}를 반환 (작업이 끝나면 종료)"""
+    request = urllib.request.Request(f"{DAEMON_URL}/jobs/{job_id}/events", headers=daemon_headers())
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            for line in response:
+                if line.strip():
+                    yield json.loads(line)
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(read_daemon_error(e))
+    except ValueError:
+        raise RuntimeError("작업 데몬의 응답을 해석할 수 없습니다.")
+
+
+def request_daemon(method, path, body=None):
+    """작업 데몬 API를 호출하고 JSON 응답을 반환"""
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    request = urllib.request.Request(f"{DAEMON_URL}{path}", data=data, headers=daemon_headers(), method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        raise RuntimeError(read_daemon_error(e))
+    except ValueError:
+        raise RuntimeError("작업 데몬의 응답을 해석할 수 없습니다.")
+
+
+def daemon_headers():
+    try:
+        with open(DAEMON_TOKEN_PATH, encoding='utf-8') as f:
+            token = f.read().strip()
+    except OSError as e:
+        raise RuntimeError(f"작업 데몬 토큰을 읽을 수 없습니다: {str(e)}")
+    return {'Content-Type': 'application/json', 'Authorization': f"Bearer {token}"}
+
+
+def read_daemon_error(http_error):
+    """데몬 오류 응답의 error 항목 (JSON이 아니면 HTTP 상태 설명)"""
+    try:
+        return json.loads(http_error.read())['error']
+    except (OSError, ValueError, KeyError, TypeError):
+        return str(http_error)
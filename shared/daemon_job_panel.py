@@ -0,0 +1,106 @@
+from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from shared.daemon_client import stream_daemon_job_events, cancel_daemon_job, STATUS_LABELS, FINISHED_STATUSES
+
+
+class DaemonJobMonitor(QThread):
+    """작업 데몬의 진행 상황 스트림(GET /jobs/<id>/events)을 받아 전달"""
+    event_received = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, job_id):
+        super().__init__()
+        self.job_id = job_id
+        self.is_running = True
+
+    def run(self):
+        while self.is_running:
+            try:
+                for event in stream_daemon_job_events(self.job_id):
+                    if not self.is_running:
+                        return
+                    self.event_received.emit(event)
+                return  # 작업이 끝나면 데몬이 스트림을 닫음
+            except TimeoutError:
+                continue  # 변화가 없는 동안 중지 요청을 확인하기 위해 다시 연결
+            except (RuntimeError, OSError) as e:
+                if self.is_running:
+                    self.error_occurred.emit(f"작업 상태를 받을 수 없습니다: {str(e)}")
+                return
+
+    def stop(self):
+        self.is_running = False
+
+
+class QueuedJobPanel(QWidget):
+    """마지막으로 대기열에 추가한 작업의 상태와 진행률 표시, 취소 버튼"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.job_id = None
+        self.monitor = None
+        self.retired_monitors = []  # 중지 요청 후 아직 끝나지 않은 이전 작업의 모니터
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.job_label = QLabel("대기열 작업: 없음")
+        layout.addWidget(self.job_label)
+
+        self.job_progress_bar = QProgressBar()
+        layout.addWidget(self.job_progress_bar)
+
+        self.cancel_btn = QPushButton("대기열 작업 취소")
+        self.cancel_btn.clicked.connect(self.cancel_job)
+        self.cancel_btn.setEnabled(False)
+        layout.addWidget(self.cancel_btn)
+
+    def watch(self, job_id):
+        self.stop_monitor()
+        self.job_id = job_id
+        self.job_label.setText(f"대기열 작업 #{job_id}: {STATUS_LABELS['queued']}")
+        self.job_progress_bar.setValue(0)
+        self.cancel_btn.setEnabled(True)
+
+        self.monitor = DaemonJobMonitor(job_id)
+        self.monitor.event_received.connect(self.on_event_received)
+        self.monitor.error_occurred.connect(self.on_monitor_error)
+        self.monitor.start()
+
+    def stop_monitor(self):
+        # 스트림 읽기가 끝날 때까지 화면이 멈추지 않도록 기다리지 않고, 끝날 때까지 참조만 유지
+        self.retired_monitors = [monitor for monitor in self.retired_monitors if monitor.isRunning()]
+        if self.monitor and self.monitor.isRunning():
+            self.monitor.stop()
+            self.retired_monitors.append(self.monitor)
+        self.monitor = None
+
+    def stop(self):
+        """창을 닫을 때 호출 - 모든 모니터 스레드가 끝날 때까지 대기"""
+        self.stop_monitor()
+        for monitor in self.retired_monitors:
+            monitor.wait()
+        self.retired_monitors = []
+
+    def on_event_received(self, event):
+        # 이전 작업의 모니터가 보낸 이벤트는 무시
+        if self.sender() is not self.monitor:
+            return
+        status = STATUS_LABELS.get(event['status'], event['status'])
+        # 실패 메시지에는 FFmpeg 로그 전체가 들어 있으므로 마지막 줄만 표시
+        lines = (event.get('message') or '').strip().splitlines()
+        message = f" - {lines[-1]}" if lines else ""
+        self.job_label.setText(f"대기열 작업 #{event['id']}: {status}{message}")
+        self.job_progress_bar.setValue(event['progress'])
+        self.cancel_btn.setEnabled(event['status'] not in FINISHED_STATUSES)
+
+    def on_monitor_error(self, error_message):
+        if self.sender() is not self.monitor:
+            return
+        self.job_label.setText(f"대기열 작업 #{self.job_id}: {error_message}")
+
+    def cancel_job(self):
+        try:
+            cancel_daemon_job(self.job_id)
+        except (RuntimeError, OSError) as e:
+            QMessageBox.critical(self, "오류", f"작업을 취소할 수 없습니다: {str(e)}")
@@ -0,0 +1,57 @@
+import os
+import json
+import shutil
+import platform
+import subprocess
+
+
+def find_ffmpeg_executable(name):
+    """FFmpeg 실행 파일을 찾는 크로스 플랫폼 함수"""
+    # Windows에서는 .exe 확장자 추가
+    if platform.system() == 'Windows':
+        if not name.endswith('.exe'):
+            name += '.exe'
+
+    # PATH에서 실행 파일 찾기
+    executable = shutil.which(name)
+    if executable:
+        return executable
+
+    # Windows에서 일반적인 FFmpeg 설치 경로들도 확인
+    if platform.system() == 'Windows':
+        common_paths = [
+            r'C:\ffmpeg\bin\{}'.format(name),
+            r'C:\Program Files\ffmpeg\bin\{}'.format(name),
+            r'C:\Program Files (x86)\ffmpeg\bin\{}'.format(name),
+        ]
+        for path in common_paths:
+            if os.path.exists(path):
+                return path
+
+    # 기본값 반환 (확장자 포함)
+    return name
+
+
+def probe_duration(file_path):
+    """ffprobe로 영상 길이(초)를 구함 (ffprobe가 없거나 실패하면 None)"""
+    ffprobe_path = find_ffmpeg_executable('ffprobe')
+    cmd = [
+        ffprobe_path, '-v', 'quiet', '-print_format', 'json',
+        '-show_entries', 'format=duration', file_path
+    ]
+    try:
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            shell=False,  # 보안을 위해 shell 사용 안함
+            creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        return float(json.loads(result.stdout)['format']['duration'])
+    except (KeyError, ValueError, TypeError):
+        return None
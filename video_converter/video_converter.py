@@ -2,40 +2,23 @@ import sys
 import os
 import subprocess
 import json
+import re
 import platform
 import shutil
+import tempfile
+import signal
+import time
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                              QWidget, QPushButton, QLabel, QFileDialog, QComboBox,
                              QProgressBar, QMessageBox, QLineEdit, QGroupBox, QCheckBox, QSpinBox, QRadioButton, QButtonGroup)
 from PyQt6.QtCore import QThread, pyqtSignal, Qt, QTimer
 from PyQt6.QtGui import QFont
 
-
-def find_ffmpeg_executable(name):
-    """FFmpeg 실행 파일을 찾는 크로스 플랫폼 함수"""
-    # Windows에서는 .exe 확장자 추가
-    if platform.system() == 'Windows':
-        if not name.endswith('.exe'):
-            name += '.exe'
-
-    # PATH에서 실행 파일 찾기
-    executable = shutil.which(name)
-    if executable:
-        return executable
-
-    # Windows에서 일반적인 FFmpeg 설치 경로들도 확인
-    if platform.system() == 'Windows':
-        common_paths = [
-            r'C:\ffmpeg\bin\{}'.format(name),
-            r'C:\Program Files\ffmpeg\bin\{}'.format(name),
-            r'C:\Program Files (x86)\ffmpeg\bin\{}'.format(name),
-        ]
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-
-    # 기본값 반환 (확장자 포함)
-    return name
+# 저장소 루트를 경로에 추가하여 프레임 추출기, 작업 데몬과 함께 쓰는 모듈을 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.ffmpeg_tools import find_ffmpeg_executable, probe_duration  # noqa: E402
+from shared.daemon_client import submit_to_daemon  # noqa: E402
+from shared.daemon_job_panel import QueuedJobPanel  # noqa: E402
 
 
 class VideoConverter(QThread):
@@ -43,8 +26,10 @@ class VideoConverter(QThread):
     conversion_finished = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
     status_updated = pyqtSignal(str)
+    process_started = pyqtSignal(int)  # FFmpeg 프로세스 PID
 
-    def __init__(self, input_path, output_path, output_format, pixel_format, width, height, scale_mode='exact', rotation=0):
+    def __init__(self, input_path, output_path, output_format, pixel_format, width, height, scale_mode='exact', rotation=0,
+                 metrics=None, command_prefix=None, creationflags=0):
         super().__init__()
         self.input_path = input_path
         self.output_path = output_path
@@ -54,70 +39,108 @@ class VideoConverter(QThread):
         self.height = height
         self.scale_mode = scale_mode
         self.rotation = rotation
+        self.metrics = metrics  # 단계별 시간 기록 (job_daemon/job_metrics.py의 JobMetrics, 선택)
+        # 자원 제한 적용용 (job_daemon/resource_governor.py의 build_launch_options)
+        self.command_prefix = command_prefix or []  # FFmpeg 명령어 앞에 붙일 명령 (예: nice -n 10)
+        self.creationflags = creationflags  # Windows 프로세스 우선순위 클래스
         self.is_running = True
+        self.is_paused = False
         self.process = None
 
+    def build_command(self, output_path=None, start_time=None, duration=None):
+        """FFmpeg 명령어 구성 (start_time / duration을 주면 해당 구간만 변환)"""
+        # FFmpeg 명령어 구성 (크로스 플랫폼)
+        ffmpeg_path = find_ffmpeg_executable('ffmpeg')
+        cmd = [ffmpeg_path]
+
+        # 샘플 구간 변환 시 입력 탐색 (예상 시간 계산용)
+        if start_time is not None:
+            cmd.extend(['-ss', f"{start_time:.3f}"])
+
+        cmd.extend(['-i', self.input_path, '-y'])
+
+        if duration is not None:
+            cmd.extend(['-t', f"{duration:.3f}"])
+
+        # 회전 메타데이터 유지 (원본과 동일하게)
+        cmd.extend(['-map_metadata', '0'])
+
+        # 픽셀 포맷 설정
+        if self.pixel_format != "원본 유지":
+            cmd.extend(['-pix_fmt', self.pixel_format])
+
+        # 비디오 필터 체인 구성
+        filters = []
+
+        # 해상도 설정
+        if self.width > 0 and self.height > 0:
+            # 회전된 영상의 경우 표시 해상도 그대로 물리적 해상도로 사용
+            # 회전 메타데이터가 보존되므로 최종 표시는 원하는 크기가 됨
+            actual_width = self.width + (self.width % 2)
+            actual_height = self.height + (self.height % 2)
+
+            if self.scale_mode == 'aspect_fit':
+                # 종횡비 유지, 지정 크기 안에 맞춤 (작아질 수 있음)
+                filters.append(f'scale={actual_width}:{actual_height}:force_original_aspect_ratio=decrease')
+                filters.append('scale=trunc(iw/2)*2:trunc(ih/2)*2')
+            elif self.scale_mode == 'aspect_pad':
+                # 종횡비 유지, 지정 크기로 패딩 (검은 여백 추가)
+                filters.append(f'scale={actual_width}:{actual_height}:force_original_aspect_ratio=decrease')
+                filters.append('scale=trunc(iw/2)*2:trunc(ih/2)*2')
+                filters.append(f'pad={actual_width}:{actual_height}:-1:-1:black')
+            else:  # exact
+                # 정확한 크기로 조정 (종횡비 무시) - 홀수도 짝수로 강제 변환
+                filters.append(f'scale={actual_width}:{actual_height}')
+
+        # 필터 체인 적용
+        if filters:
+            cmd.extend(['-vf', ','.join(filters)])
+
+        # 출력 경로 추가
+        cmd.append(output_path or self.output_path)
+        return cmd
+
     def run(self):
         try:
-            # FFmpeg 명령어 구성 (크로스 플랫폼)
-            ffmpeg_path = find_ffmpeg_executable('ffmpeg')
-            cmd = [ffmpeg_path]
-
-            cmd.extend(['-i', self.input_path, '-y'])
-
-            # 회전 메타데이터 유지 (원본과 동일하게)
-            cmd.extend(['-map_metadata', '0'])
-
-            # 픽셀 포맷 설정
-            if self.pixel_format != "원본 유지":
-                cmd.extend(['-pix_fmt', self.pixel_format])
-
-            # 비디오 필터 체인 구성
-            filters = []
-
-
-            # 해상도 설정
-            if self.width > 0 and self.height > 0:
-                # 회전된 영상의 경우 표시 해상도 그대로 물리적 해상도로 사용
-                # 회전 메타데이터가 보존되므로 최종 표시는 원하는 크기가 됨
-                actual_width = self.width + (self.width % 2)
-                actual_height = self.height + (self.height % 2)
-
-                if self.scale_mode == 'aspect_fit':
-                    # 종횡비 유지, 지정 크기 안에 맞춤 (작아질 수 있음)
-                    filters.append(f'scale={actual_width}:{actual_height}:force_original_aspect_ratio=decrease')
-                    filters.append('scale=trunc(iw/2)*2:trunc(ih/2)*2')
-                elif self.scale_mode == 'aspect_pad':
-                    # 종횡비 유지, 지정 크기로 패딩 (검은 여백 추가)
-                    filters.append(f'scale={actual_width}:{actual_height}:force_original_aspect_ratio=decrease')
-                    filters.append('scale=trunc(iw/2)*2:trunc(ih/2)*2')
-                    filters.append(f'pad={actual_width}:{actual_height}:-1:-1:black')
-                else:  # exact
-                    # 정확한 크기로 조정 (종횡비 무시) - 홀수도 짝수로 강제 변환
-                    filters.append(f'scale={actual_width}:{actual_height}')
-
-            # 필터 체인 적용
-            if filters:
-                cmd.extend(['-vf', ','.join(filters)])
-
-            # 출력 경로 추가
-            cmd.append(self.output_path)
+            cmd = self.build_command()
 
             self.status_updated.emit(f"변환 명령어: {' '.join(cmd)}")
 
+            # 시작 전에 중지 요청된 경우 FFmpeg를 실행하지 않음
+            if not self.is_running:
+                return
+
             # FFmpeg 프로세스 실행 (크로스 플랫폼 호환)
+            process_start = time.perf_counter()
             self.process = subprocess.Popen(
-                cmd,
+                self.command_prefix + cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 universal_newlines=True,
                 shell=False,  # 보안을 위해 shell 사용 안함
-                creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0
+                creationflags=self.creationflags | (subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0)
             )
+            if self.is_running:
+                self.process_started.emit(self.process.pid)
+            else:
+                # Popen 도중 stop()이 호출되면 종료할 프로세스가 없었으므로 여기서 종료
+                self.stop()
 
             # 프로세스 완료 대기
             stdout, stderr = self.process.communicate()
 
+            if self.metrics is not None:
+                self.metrics.observe('subprocess', time.perf_counter() - process_start)
+                # 진행 로그의 frame=은 인코딩된 프레임 수, 복제(dup) / 버림(drop)을 되돌리면 디코딩된 프레임 수
+                frames_written = read_ffmpeg_progress(stderr, 'frame')
+                if frames_written is not None:
+                    dropped = read_ffmpeg_progress(stderr, 'drop') or 0
+                    duplicated = read_ffmpeg_progress(stderr, 'dup') or 0
+                    self.metrics.add('frames_written', frames_written)
+                    self.metrics.add('frames_decoded', frames_written - duplicated + dropped)
+                if self.process.returncode == 0 and os.path.exists(self.output_path):
+                    self.metrics.add('bytes_written', os.path.getsize(self.output_path))
+
             if self.process.returncode == 0:
                 self.conversion_finished.emit("비디오 변환이 완료되었습니다.")
             else:
@@ -126,14 +149,30 @@ class VideoConverter(QThread):
         except Exception as e:
             self.error_occurred.emit(f"오류 발생: {str(e)}")
 
+    def pause(self):
+        """FFmpeg 프로세스 일시 정지 (SIGSTOP, Unix 전용)"""
+        if self.process and self.process.poll() is None and hasattr(signal, 'SIGSTOP'):
+            os.kill(self.process.pid, signal.SIGSTOP)
+            self.is_paused = True
+            return True
+        return False
+
+    def resume(self):
+        if self.process and self.is_paused:
+            os.kill(self.process.pid, signal.SIGCONT)
+            self.is_paused = False
+            return True
+        return False
+
     def stop(self):
         self.is_running = False
         if self.process:
             try:
+                # 일시 정지된 프로세스는 종료 신호를 처리할 수 있도록 먼저 재개
+                self.resume()
                 # Windows와 Unix 모두에서 안전한 프로세스 종료
                 self.process.terminate()
                 # Windows에서는 terminate()가 즉시 종료되지 않을 수 있으므로 잠시 대기
-                import time
                 time.sleep(0.1)
                 if self.process.poll() is None:  # 아직 종료되지 않았다면
                     self.process.kill()  # 강제 종료
@@ -141,10 +180,126 @@ class VideoConverter(QThread):
                 pass  # 프로세스가 이미 종료된 경우 무시
 
 
+def read_ffmpeg_progress(stderr, name):
+    """FFmpeg 진행 로그(stderr)에서 name= 항목의 마지막 값 (없으면 None)"""
+    values = re.findall(rf'\b{name}=\s*(\d+)', stderr)
+    return int(values[-1]) if values else None
+
+
+def estimate_conversion(converter, segment_count=3, segment_duration=5.0, on_process_started=None):
+    """
+    영상 전체에 고르게 분포한 짧은 구간을 실제 변환 설정 그대로 인코딩해서
+    전체 변환 시간, 인코딩 속도, 출력 파일 크기를 추정
+    """
+    duration = probe_duration(converter.input_path)
+    if not duration:
+        raise RuntimeError("영상 길이를 확인할 수 없습니다.")
+
+    segment_duration = min(segment_duration, duration / segment_count)
+    temp_dir = tempfile.mkdtemp(prefix='dabin-estimate-')
+    segments = []
+    try:
+        for index in range(segment_count):
+            # 각 구간을 균등하게 나눈 범위의 중앙에 배치
+            start_time = max(0.0, duration * (index + 0.5) / segment_count - segment_duration / 2)
+            output_path = os.path.join(temp_dir, f"segment_{index}.{converter.output_format}")
+            cmd = converter.build_command(output_path, start_time, segment_duration)
+
+            segment_start = time.perf_counter()
+            # 실제 변환과 같은 자원 제한으로 실행
+            process = subprocess.Popen(
+                converter.command_prefix + cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                universal_newlines=True,
+                shell=False,  # 보안을 위해 shell 사용 안함
+                creationflags=converter.creationflags | (
+                    subprocess.CREATE_NO_WINDOW if platform.system() == 'Windows' else 0)
+            )
+            if on_process_started:
+                on_process_started(process)
+            _, stderr = process.communicate()
+            wall_time = time.perf_counter() - segment_start
+
+            if process.returncode != 0:
+                raise RuntimeError(f"샘플 구간 변환 실패: {stderr}")
+
+            segments.append({
+                'start_time': round(start_time, 3),
+                'duration': round(segment_duration, 3),
+                'wall_time': round(wall_time, 3),
+                'output_bytes': os.path.getsize(output_path),
+                'frames': read_ffmpeg_progress(stderr, 'frame'),  # 인코딩된 프레임 수
+            })
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    sampled_duration = sum(segment['duration'] for segment in segments)
+    sampled_wall_time = sum(segment['wall_time'] for segment in segments)
+    sampled_bytes = sum(segment['output_bytes'] for segment in segments)
+    frame_counts = [segment['frames'] for segment in segments if segment['frames'] is not None]
+
+    # 구간마다 FFmpeg 시작 비용이 포함되므로 짧은 영상일수록 다소 보수적으로 추정됨
+    return {
+        'duration': round(duration, 3),
+        'estimated_seconds': round(sampled_wall_time / sampled_duration * duration, 1),
+        'estimated_bytes': int(sampled_bytes / sampled_duration * duration),
+        'encode_fps': round(sum(frame_counts) / sampled_wall_time, 1) if frame_counts and sampled_wall_time else None,
+        'speed': round(sampled_duration / sampled_wall_time, 2) if sampled_wall_time else None,
+        'segments': segments,
+    }
+
+
+def format_estimate(estimate):
+    minutes, seconds = divmod(int(estimate['estimated_seconds']), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        time_text = f"{hours}시간 {minutes}분"
+    elif minutes:
+        time_text = f"{minutes}분 {seconds}초"
+    else:
+        time_text = f"{seconds}초"
+    size_mb = estimate['estimated_bytes'] / (1024 * 1024)
+    fps_text = f", 인코딩 {estimate['encode_fps']}fps" if estimate['encode_fps'] else ""
+    return f"예상 변환 시간 약 {time_text}, 출력 크기 약 {size_mb:.1f}MB (x{estimate['speed']}{fps_text})"
+
+
+class ConversionEstimator(QThread):
+    estimate_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, converter):
+        super().__init__()
+        self.converter = converter
+        self.process = None
+        self.is_running = True
+
+    def run(self):
+        try:
+            estimate = estimate_conversion(self.converter, on_process_started=self.set_process)
+            self.estimate_ready.emit(estimate)
+        except Exception as e:
+            # 중지로 샘플 변환이 실패한 경우는 오류로 알리지 않음
+            if self.is_running:
+                self.error_occurred.emit(f"예상 시간 계산 실패: {str(e)}")
+
+    def set_process(self, process):
+        self.process = process
+        # 구간 사이에 중지 요청된 경우 새로 시작한 샘플 변환도 바로 종료
+        if not self.is_running:
+            process.kill()
+
+    def stop(self):
+        self.is_running = False
+        if self.process and self.process.poll() is None:
+            self.process.kill()
+
+
 class VideoConverterApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.video_converter = None
+        self.conversion_estimator = None
         self.input_path = ""
         self.output_path = ""
         self.original_width = 0
@@ -327,6 +482,16 @@ class VideoConverterApp(QMainWindow):
         self.convert_btn.setEnabled(False)
         button_layout.addWidget(self.convert_btn)
 
+        self.estimate_btn = QPushButton("예상 시간 계산")
+        self.estimate_btn.clicked.connect(self.start_estimate)
+        self.estimate_btn.setEnabled(False)
+        button_layout.addWidget(self.estimate_btn)
+
+        self.enqueue_btn = QPushButton("대기열에 추가")
+        self.enqueue_btn.clicked.connect(self.enqueue_conversion)
+        self.enqueue_btn.setEnabled(False)
+        button_layout.addWidget(self.enqueue_btn)
+
         self.stop_btn = QPushButton("변환 중지")
         self.stop_btn.clicked.connect(self.stop_conversion)
         self.stop_btn.setEnabled(False)
@@ -337,6 +502,15 @@ class VideoConverterApp(QMainWindow):
         self.progress_bar = QProgressBar()
         layout.addWidget(self.progress_bar)
 
+        # 예상 변환 시간 / 출력 크기
+        self.estimate_label = QLabel("예상: 변환 전에 '예상 시간 계산'을 눌러 확인하세요")
+        self.estimate_label.setStyleSheet("color: #666;")
+        layout.addWidget(self.estimate_label)
+
+        # 대기열에 추가한 작업 (작업 데몬에서 상태를 받아 표시)
+        self.queued_job_panel = QueuedJobPanel()
+        layout.addWidget(self.queued_job_panel)
+
         # 상태 표시
         self.status_label = QLabel("상태: 준비")
         layout.addWidget(self.status_label)
@@ -374,16 +548,27 @@ class VideoConverterApp(QMainWindow):
     def check_ready(self):
         if self.input_path and self.output_path and self.filename_input.text().strip():
             self.convert_btn.setEnabled(True)
+            self.enqueue_btn.setEnabled(True)
+            # 예상 시간 계산 중이거나 변환 중이면 다시 누를 수 없도록 유지
+            if not self.is_estimating() and not self.is_converting():
+                self.estimate_btn.setEnabled(True)
 
-    def start_conversion(self):
+    def is_converting(self):
+        return self.video_converter is not None and self.video_converter.isRunning()
+
+    def is_estimating(self):
+        return self.conversion_estimator is not None and self.conversion_estimator.isRunning()
+
+    def build_conversion_params(self, confirm_overwrite=True):
+        """현재 설정으로 VideoConverter 인자를 구성 (취소되거나 설정이 부족하면 None)"""
         if not self.input_path or not self.output_path:
             QMessageBox.warning(self, "경고", "입력 파일과 출력 경로를 선택해주세요.")
-            return
+            return None
 
         filename = self.filename_input.text().strip()
         if not filename:
             QMessageBox.warning(self, "경고", "출력 파일명을 입력해주세요.")
-            return
+            return None
 
         output_format = self.format_combo.currentText()
         pixel_format = self.pixel_combo.currentText()
@@ -401,18 +586,36 @@ class VideoConverterApp(QMainWindow):
         full_output_path = os.path.join(self.output_path, f"{filename}.{output_format}")
 
         # 파일이 이미 존재하는지 확인
-        if os.path.exists(full_output_path):
+        if confirm_overwrite and os.path.exists(full_output_path):
             reply = QMessageBox.question(
                 self, "파일 존재",
                 f"파일 '{filename}.{output_format}'이 이미 존재합니다. 덮어쓰시겠습니까?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.No:
-                return
+                return None
+
+        return {
+            'input_path': self.input_path,
+            'output_path': full_output_path,
+            'output_format': output_format,
+            'pixel_format': pixel_format,
+            'width': width,
+            'height': height,
+            'scale_mode': scale_mode,
+            'rotation': self.rotation,
+        }
 
-        self.video_converter = VideoConverter(
-            self.input_path, full_output_path, output_format, pixel_format, width, height, scale_mode, self.rotation
-        )
+    def start_conversion(self):
+        params = self.build_conversion_params()
+        if params is None:
+            return
+
+        # 실제 변환과 샘플 변환이 CPU를 나눠 쓰지 않도록 진행 중인 예상 시간 계산은 중지
+        self.stop_estimate()
+        self.estimate_btn.setEnabled(False)
+
+        self.video_converter = VideoConverter(**params)
 
         self.video_converter.progress_updated.connect(self.update_progress)
         self.video_converter.conversion_finished.connect(self.on_conversion_finished)
@@ -426,12 +629,68 @@ class VideoConverterApp(QMainWindow):
         self.status_label.setText("상태: 변환 중...")
         self.progress_bar.setRange(0, 0)  # 무한 진행바
 
+    def start_estimate(self):
+        if self.is_converting():
+            QMessageBox.warning(self, "경고", "변환 중에는 예상 시간을 계산할 수 없습니다.")
+            return
+
+        params = self.build_conversion_params(confirm_overwrite=False)
+        if params is None:
+            return
+
+        # 이전 계산이 남아 있으면 먼저 종료 (참조를 잃은 스레드와 샘플 변환 프로세스가 남지 않도록)
+        self.stop_estimate()
+
+        # 실행하지 않는 VideoConverter는 FFmpeg 명령어 구성에만 사용
+        self.conversion_estimator = ConversionEstimator(VideoConverter(**params))
+        self.conversion_estimator.estimate_ready.connect(self.on_estimate_ready)
+        self.conversion_estimator.error_occurred.connect(self.on_estimate_error)
+        self.conversion_estimator.start()
+
+        self.estimate_btn.setEnabled(False)
+        self.estimate_label.setText("예상: 샘플 구간 변환 중...")
+
+    def stop_estimate(self):
+        if self.conversion_estimator and self.conversion_estimator.isRunning():
+            self.conversion_estimator.stop()
+            self.conversion_estimator.wait()
+            self.estimate_btn.setEnabled(not self.is_converting())
+            self.estimate_label.setText("예상: 계산이 중지되었습니다")
+
+    def on_estimate_ready(self, estimate):
+        # 중지된 이전 계산의 결과가 늦게 도착한 경우 무시
+        if self.sender() is not self.conversion_estimator:
+            return
+        self.estimate_btn.setEnabled(not self.is_converting())
+        self.estimate_label.setText(f"예상: {format_estimate(estimate)}")
+
+    def on_estimate_error(self, error_message):
+        if self.sender() is not self.conversion_estimator:
+            return
+        self.estimate_btn.setEnabled(not self.is_converting())
+        self.estimate_label.setText(f"예상: {error_message}")
+
+    def enqueue_conversion(self):
+        params = self.build_conversion_params()
+        if params is None:
+            return
+
+        try:
+            job_id = submit_to_daemon('convert', params)
+        except (RuntimeError, OSError) as e:
+            QMessageBox.critical(self, "오류", f"작업 데몬에 연결할 수 없습니다: {str(e)}")
+            return
+
+        self.status_label.setText(f"상태: 대기열에 추가됨 (작업 #{job_id})")
+        self.queued_job_panel.watch(job_id)
+
     def stop_conversion(self):
         if self.video_converter:
             self.video_converter.stop()
             self.video_converter.wait()
 
         self.convert_btn.setEnabled(True)
+        self.estimate_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText("상태: 변환 중지됨")
         self.progress_bar.setRange(0, 100)
@@ -445,6 +704,7 @@ class VideoConverterApp(QMainWindow):
 
     def on_conversion_finished(self, message):
         self.convert_btn.setEnabled(True)
+        self.estimate_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText(f"상태: {message}")
         self.progress_bar.setRange(0, 100)
@@ -453,12 +713,19 @@ class VideoConverterApp(QMainWindow):
 
     def on_error_occurred(self, error_message):
         self.convert_btn.setEnabled(True)
+        self.estimate_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         self.status_label.setText(f"상태: 오류 - {error_message}")
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         QMessageBox.critical(self, "오류", error_message)
 
+    def closeEvent(self, event):
+        # 창을 닫을 때 샘플 변환 FFmpeg 프로세스와 스레드가 남지 않도록 정리
+        self.stop_estimate()
+        self.queued_job_panel.stop()
+        super().closeEvent(event)
+
     def extract_video_info(self, file_path):
         try:
             # ffprobe를 사용하여 비디오 정보 추출 (크로스 플랫폼)
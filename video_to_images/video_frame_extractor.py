@@ -1,12 +1,56 @@
 import sys
 import os
+import math
+import time
+import threading
 import cv2
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
                              QWidget, QPushButton, QLabel, QFileDialog, QSpinBox,
-                             QProgressBar, QMessageBox, QCheckBox)
+                             QProgressBar, QMessageBox, QCheckBox, QRadioButton, QButtonGroup)
 from PyQt6.QtCore import QThread, pyqtSignal, Qt
 from PyQt6.QtGui import QFont
 
+# 저장소 루트를 경로에 추가하여 비디오 변환기, 작업 데몬과 함께 쓰는 모듈을 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.ffmpeg_tools import probe_duration  # noqa: E402
+from shared.daemon_client import submit_to_daemon  # noqa: E402
+from shared.daemon_job_panel import QueuedJobPanel  # noqa: E402
+
+
+# 다음 목표 시각이 현재 위치보다 이 시간(초) 이상 떨어져 있으면 순차 디코딩 대신 탐색(seek)
+SEEK_THRESHOLD = 3.0
+# 탐색 시 목표 시각보다 앞쪽으로 두는 여유 시간(초) - 목표를 지나쳐 도착하지 않도록 함
+SEEK_MARGIN = 1.0
+MAX_SEEK_RETRIES = 3
+
+# 샘플링 기준 ('interval': interval초마다 1장, 'fps': 초당 custom_fps장)
+SAMPLE_MODES = ('interval', 'fps')
+
+
+def validate_sampling(sample_mode, interval, custom_fps, extract_all=False):
+    """샘플링 설정을 검사하고 잘못되었으면 ValueError 발생"""
+    if sample_mode not in SAMPLE_MODES:
+        raise ValueError(f"알 수 없는 샘플링 기준: {sample_mode} ({' / '.join(SAMPLE_MODES)} 중 하나)")
+    if extract_all:
+        return
+    name, value = ('interval', interval) if sample_mode == 'interval' else ('custom_fps', custom_fps)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value < float('inf'):
+        raise ValueError(f"{name} 값은 0보다 큰 숫자여야 합니다: {value}")
+
+
+def video_duration(video_path, cap):
+    """영상 길이(초) - ffprobe 우선, 없으면 OpenCV 메타데이터로 추정 (알 수 없으면 None)"""
+    duration = probe_duration(video_path)
+    if duration:
+        return duration
+
+    # 가변 프레임레이트 영상에서는 부정확할 수 있음
+    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if frame_count > 0 and fps > 0:
+        return frame_count / fps
+    return None
+
 
 class VideoProcessor(QThread):
     progress_updated = pyqtSignal(int)
@@ -14,14 +58,20 @@ class VideoProcessor(QThread):
     finished_extraction = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, video_path, output_dir, interval, extract_all=False, custom_fps=1):
+    def __init__(self, video_path, output_dir, interval, extract_all=False, custom_fps=1, metrics=None,
+                 sample_mode='fps'):
         super().__init__()
+        validate_sampling(sample_mode, interval, custom_fps, extract_all)
         self.video_path = video_path
         self.output_dir = output_dir
         self.interval = interval
         self.extract_all = extract_all
         self.custom_fps = custom_fps
+        self.sample_mode = sample_mode  # SAMPLE_MODES 중 하나
+        self.metrics = metrics  # 단계별 시간 기록 (job_daemon/job_metrics.py의 JobMetrics, 선택)
         self.is_running = True
+        self.resume_event = threading.Event()  # 해제되면 일시 정지
+        self.resume_event.set()
 
     def run(self):
         try:
@@ -30,34 +80,11 @@ class VideoProcessor(QThread):
                 self.error_occurred.emit("동영상 파일을 열 수 없습니다.")
                 return
 
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            original_fps = cap.get(cv2.CAP_PROP_FPS)
-
-            frame_count = 0
-            saved_count = 0
-
+            duration = video_duration(self.video_path, cap)
             if self.extract_all:
-                frame_interval = 1
+                saved_count = self.extract_all_frames(cap, duration)
             else:
-                # 설정된 FPS에 따라 추출할 프레임 간격 계산
-                frame_interval = max(1, int(original_fps / self.custom_fps))
-
-            while self.is_running:
-                ret, frame = cap.read()
-                if not ret:
-                    break
-
-                if self.extract_all or (frame_count % frame_interval == 0):
-                    filename = f"frame_{saved_count:03d}.jpg"
-                    filepath = os.path.join(self.output_dir, filename)
-
-                    cv2.imwrite(filepath, frame)
-                    saved_count += 1
-                    self.frame_extracted.emit(saved_count, filename)
-
-                frame_count += 1
-                progress = int((frame_count / total_frames) * 100)
-                self.progress_updated.emit(progress)
+                saved_count = self.extract_sampled_frames(cap, duration)
 
             cap.release()
             self.finished_extraction.emit(f"추출 완료: {saved_count}개 프레임이 저장되었습니다.")
@@ -65,8 +92,146 @@ class VideoProcessor(QThread):
         except Exception as e:
             self.error_occurred.emit(f"오류 발생: {str(e)}")
 
+    def extract_all_frames(self, cap, duration):
+        saved_count = 0
+        while self.wait_if_paused():
+            timestamp = self.grab_frame(cap)
+            if timestamp is None:
+                break
+
+            self.retrieve_and_save(cap, saved_count)
+            saved_count += 1
+            if duration:
+                self.progress_updated.emit(min(100, int(timestamp / duration * 100)))
+        return saved_count
+
+    def extract_sampled_frames(self, cap, duration):
+        """
+        표시 시각(PTS) 기준으로 목표 시각 0, step, 2*step, ... 에 가장 가까운 프레임만 저장
+        컨테이너의 FPS / 프레임 수 메타데이터에 의존하지 않으므로 가변 프레임레이트 영상에서도 간격이 유지됨
+        """
+        if self.sample_mode == 'interval':
+            step = float(self.interval)
+        else:
+            step = 1.0 / self.custom_fps
+        total_samples = math.ceil(duration / step) if duration else None
+
+        # 목표 시각과 프레임 시각의 허용 오차 (프레임 간격의 절반, 실제 간격이 측정되면 갱신)
+        nominal_fps = cap.get(cv2.CAP_PROP_FPS)
+        tolerance = 0.5 / nominal_fps if nominal_fps > 0 else 0.0
+
+        saved_count = 0
+        target_index = 0
+        timestamp = None
+        previous_timestamp = None
+        while self.wait_if_paused():
+            if total_samples is not None and target_index >= total_samples:
+                break
+            target = target_index * step
+
+            if timestamp is not None and target - timestamp > SEEK_THRESHOLD:
+                timestamp = self.seek_to(cap, target, tolerance)
+                previous_timestamp = None
+            else:
+                timestamp = self.grab_frame(cap)
+            if timestamp is None:
+                break
+
+            if previous_timestamp is not None and timestamp > previous_timestamp:
+                tolerance = (timestamp - previous_timestamp) / 2
+            previous_timestamp = timestamp
+
+            if timestamp + tolerance < target:
+                continue  # 아직 목표 시각 전 - 디코딩만 하고 변환 / 저장은 생략
+
+            self.retrieve_and_save(cap, saved_count)
+            saved_count += 1
+
+            # 요청 간격이 프레임 간격보다 짧으면 같은 프레임이 여러 목표 시각을 대표함
+            while target_index * step <= timestamp + tolerance:
+                target_index += 1
+            if total_samples:
+                self.progress_updated.emit(min(100, int(target_index / total_samples * 100)))
+        return saved_count
+
+    def seek_to(self, cap, target, tolerance):
+        """목표 시각 직전으로 탐색한 뒤 첫 프레임을 grab하고 그 표시 시각을 반환"""
+        margin = SEEK_MARGIN
+        timestamp = None
+        for _ in range(MAX_SEEK_RETRIES):
+            position = max(0.0, target - margin)
+            seek_start = time.perf_counter()
+            cap.set(cv2.CAP_PROP_POS_MSEC, position * 1000)
+            if self.metrics is not None:
+                self.metrics.observe('seek', time.perf_counter() - seek_start)
+
+            timestamp = self.grab_frame(cap)
+            if timestamp is None or timestamp <= target + tolerance or position == 0:
+                break
+            # OpenCV는 FPS 기준으로 탐색 위치를 계산하므로 가변 프레임레이트 영상에서는
+            # 목표를 지나칠 수 있음 - 더 앞쪽에서 다시 탐색
+            margin *= 2
+        return timestamp
+
+    def grab_frame(self, cap):
+        """다음 프레임을 디코딩하고 표시 시각(초)을 반환 (영상 끝이면 None)"""
+        decode_start = time.perf_counter()
+        if not cap.grab():
+            return None
+        if self.metrics is not None:
+            self.metrics.observe('decode', time.perf_counter() - decode_start)
+            self.metrics.add('frames_decoded')
+        return cap.get(cv2.CAP_PROP_POS_MSEC) / 1000
+
+    def retrieve_and_save(self, cap, saved_count):
+        retrieve_start = time.perf_counter()
+        ret, frame = cap.retrieve()
+        if not ret:
+            raise RuntimeError("프레임을 가져올 수 없습니다.")
+        if self.metrics is not None:
+            self.metrics.observe('retrieve', time.perf_counter() - retrieve_start)
+
+        filename = f"frame_{saved_count:03d}.jpg"
+        self.save_frame(os.path.join(self.output_dir, filename), frame)
+        self.frame_extracted.emit(saved_count + 1, filename)
+
+    def wait_if_paused(self):
+        """일시 정지 중이면 재개될 때까지 대기하고 계속 실행할지 반환"""
+        self.resume_event.wait()
+        return self.is_running
+
+    def save_frame(self, filepath, frame):
+        if self.metrics is None:
+            # 측정하지 않을 때는 기존과 같이 cv2.imwrite로 저장
+            cv2.imwrite(filepath, frame)
+            return
+
+        # 인코딩과 파일 쓰기를 나눠서 각 단계 시간을 따로 측정
+        encode_start = time.perf_counter()
+        ok, buffer = cv2.imencode('.jpg', frame)
+        if not ok:
+            raise RuntimeError(f"이미지 인코딩 실패: {os.path.basename(filepath)}")
+
+        write_start = time.perf_counter()
+        with open(filepath, 'wb') as f:
+            f.write(buffer.tobytes())
+
+        self.metrics.observe('encode', write_start - encode_start)
+        self.metrics.observe('write', time.perf_counter() - write_start)
+        self.metrics.add('frames_written')
+        self.metrics.add('bytes_written', len(buffer))
+
+    def pause(self):
+        self.resume_event.clear()
+        return True
+
+    def resume(self):
+        self.resume_event.set()
+        return True
+
     def stop(self):
         self.is_running = False
+        self.resume_event.set()
 
 
 class VideoFrameExtractor(QMainWindow):
@@ -113,8 +278,16 @@ class VideoFrameExtractor(QMainWindow):
 
         settings_layout = QVBoxLayout()
 
+        # 샘플링 기준 선택 (간격 또는 FPS)
+        self.sample_mode_group = QButtonGroup()
+        self.interval_radio = QRadioButton("추출 간격 (초):")
+        self.fps_radio = QRadioButton("초당 프레임 수 (FPS):")
+        self.fps_radio.setChecked(True)  # 기본값
+        self.sample_mode_group.addButton(self.interval_radio, 0)
+        self.sample_mode_group.addButton(self.fps_radio, 1)
+
         interval_layout = QHBoxLayout()
-        interval_layout.addWidget(QLabel("추출 간격 (초):"))
+        interval_layout.addWidget(self.interval_radio)
         self.interval_spinbox = QSpinBox()
         self.interval_spinbox.setMinimum(1)
         self.interval_spinbox.setMaximum(60)
@@ -125,7 +298,7 @@ class VideoFrameExtractor(QMainWindow):
         settings_layout.addLayout(interval_layout)
 
         fps_layout = QHBoxLayout()
-        fps_layout.addWidget(QLabel("초당 프레임 수 (FPS):"))
+        fps_layout.addWidget(self.fps_radio)
         self.fps_spinbox = QSpinBox()
         self.fps_spinbox.setMinimum(1)
         self.fps_spinbox.setMaximum(60)
@@ -137,13 +310,20 @@ class VideoFrameExtractor(QMainWindow):
 
         layout.addLayout(settings_layout)
 
-        self.extract_all_checkbox.toggled.connect(self.on_extract_all_toggled)
+        self.extract_all_checkbox.toggled.connect(self.update_sampling_controls)
+        self.interval_radio.toggled.connect(self.update_sampling_controls)
+        self.update_sampling_controls()
 
         self.start_btn = QPushButton("프레임 추출 시작")
         self.start_btn.clicked.connect(self.start_extraction)
         self.start_btn.setEnabled(False)
         layout.addWidget(self.start_btn)
 
+        self.enqueue_btn = QPushButton("대기열에 추가")
+        self.enqueue_btn.clicked.connect(self.enqueue_extraction)
+        self.enqueue_btn.setEnabled(False)
+        layout.addWidget(self.enqueue_btn)
+
         self.stop_btn = QPushButton("중지")
         self.stop_btn.clicked.connect(self.stop_extraction)
         self.stop_btn.setEnabled(False)
@@ -155,12 +335,19 @@ class VideoFrameExtractor(QMainWindow):
         self.status_label = QLabel("상태: 준비")
         layout.addWidget(self.status_label)
 
+        # 대기열에 추가한 작업 (작업 데몬에서 상태를 받아 표시)
+        self.queued_job_panel = QueuedJobPanel()
+        layout.addWidget(self.queued_job_panel)
+
         self.video_path = ""
         self.output_path = ""
 
-    def on_extract_all_toggled(self, checked):
-        self.interval_spinbox.setEnabled(not checked)
-        self.fps_spinbox.setEnabled(not checked)
+    def update_sampling_controls(self):
+        sampling = not self.extract_all_checkbox.isChecked()
+        self.interval_radio.setEnabled(sampling)
+        self.fps_radio.setEnabled(sampling)
+        self.interval_spinbox.setEnabled(sampling and self.interval_radio.isChecked())
+        self.fps_spinbox.setEnabled(sampling and self.fps_radio.isChecked())
 
     def browse_video(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -182,18 +369,23 @@ class VideoFrameExtractor(QMainWindow):
     def check_ready(self):
         if self.video_path and self.output_path:
             self.start_btn.setEnabled(True)
+            self.enqueue_btn.setEnabled(True)
+
+    def build_extraction_params(self):
+        return {
+            'video_path': self.video_path,
+            'output_dir': self.output_path,
+            'interval': self.interval_spinbox.value(),
+            'extract_all': self.extract_all_checkbox.isChecked(),
+            'custom_fps': self.fps_spinbox.value(),
+            'sample_mode': 'interval' if self.interval_radio.isChecked() else 'fps',
+        }
 
     def start_extraction(self):
         if not os.path.exists(self.output_path):
             os.makedirs(self.output_path)
 
-        extract_all = self.extract_all_checkbox.isChecked()
-        interval = self.interval_spinbox.value()
-        custom_fps = self.fps_spinbox.value()
-
-        self.video_processor = VideoProcessor(
-            self.video_path, self.output_path, interval, extract_all, custom_fps
-        )
+        self.video_processor = VideoProcessor(**self.build_extraction_params())
         self.video_processor.progress_updated.connect(self.update_progress)
         self.video_processor.frame_extracted.connect(self.on_frame_extracted)
         self.video_processor.finished_extraction.connect(self.on_extraction_finished)
@@ -206,6 +398,16 @@ class VideoFrameExtractor(QMainWindow):
         self.status_label.setText("상태: 프레임 추출 중...")
         self.progress_bar.setValue(0)
 
+    def enqueue_extraction(self):
+        try:
+            job_id = submit_to_daemon('extract', self.build_extraction_params())
+        except (RuntimeError, OSError) as e:
+            QMessageBox.critical(self, "오류", f"작업 데몬에 연결할 수 없습니다: {str(e)}")
+            return
+
+        self.status_label.setText(f"상태: 대기열에 추가됨 (작업 #{job_id})")
+        self.queued_job_panel.watch(job_id)
+
     def stop_extraction(self):
         if self.video_processor:
             self.video_processor.stop()
@@ -233,6 +435,10 @@ class VideoFrameExtractor(QMainWindow):
         self.status_label.setText(f"상태: 오류 - {error_message}")
         QMessageBox.critical(self, "오류", error_message)
 
+    def closeEvent(self, event):
+        self.queued_job_panel.stop()
+        super().closeEvent(event)
+
 
 def main():
     app = QApplication(sys.argv)